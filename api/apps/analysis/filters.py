@@ -0,0 +1,53 @@
+from django import forms
+from django.db.models import Q
+from django_filters import rest_framework as filters
+from rest_framework.exceptions import ValidationError
+
+from apps.core.utils import parse_bool
+
+from .models import SimilarityAnalysis
+
+
+class IntegerFilter(filters.NumberFilter):
+    """정수만 허용하는 NumberFilter (기본 DecimalField는 1.5 등 소수 허용)"""
+
+    field_class = forms.IntegerField
+
+
+class SimilarityAnalysisFilter(filters.FilterSet):
+    """유사도 분석 목록 필터 (쿼리 파라미터 파싱 및 타입 변환)"""
+
+    min_score = filters.NumberFilter(
+        field_name="similarity_score",
+        lookup_expr="gte",
+    )
+    max_score = filters.NumberFilter(
+        field_name="similarity_score",
+        lookup_expr="lte",
+    )
+    fingerprint_method = filters.CharFilter(field_name="fingerprint_method")
+    is_current = filters.CharFilter(method="filter_is_current")
+    compound_id = IntegerFilter(method="filter_compound_id", min_value=1)
+
+    class Meta:
+        model = SimilarityAnalysis
+        fields = [
+            "min_score",
+            "max_score",
+            "fingerprint_method",
+            "is_current",
+            "compound_id",
+        ]
+
+    def filter_is_current(self, queryset, name, value):
+        """최신 결과 여부 필터 (알 수 없는 값은 400)"""
+        is_current = parse_bool(value)
+        if is_current is None:
+            raise ValidationError({name: ["true/false 값이어야 합니다."]})
+        return queryset.filter(is_current=is_current)
+
+    def filter_compound_id(self, queryset, name, value):
+        """대상/비교 어느 쪽이든 해당 화합물이 포함된 분석"""
+        return queryset.filter(
+            Q(target_compound_id=value) | Q(similar_compound_id=value)
+        )
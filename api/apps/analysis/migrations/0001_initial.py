@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:19
+
+import django.core.validators
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('compounds', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SimilarityAnalysis',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('similarity_score', models.FloatField(db_index=True, validators=[django.core.validators.MinValueValidator(0.0), django.core.validators.MaxValueValidator(1.0)], verbose_name='유사도 점수')),
+                ('fingerprint_method', models.CharField(default='Morgan_r2_2048', max_length=50, verbose_name='지문 방법')),
+                ('similarity_metric', models.CharField(default='Tanimoto', max_length=50, verbose_name='유사도 지표')),
+                ('analysis_date', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('is_current', models.BooleanField(db_index=True, default=True, verbose_name='최신 결과 여부')),
+                ('similar_compound', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='similarities_as_comparison', to='compounds.compound', verbose_name='비교 화합물')),
+                ('target_compound', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='similarities_as_target', to='compounds.compound', verbose_name='대상 화합물')),
+            ],
+            options={
+                'verbose_name': '유사도 분석',
+                'verbose_name_plural': '유사도 분석 결과',
+                'db_table': 'compound_similarities',
+                'indexes': [models.Index(fields=['target_compound', '-similarity_score'], name='compound_si_target__e6c76b_idx'), models.Index(fields=['similarity_score', 'is_current'], name='compound_si_similar_dbb892_idx'), models.Index(fields=['analysis_date'], name='compound_si_analysi_409794_idx')],
+                'constraints': [models.CheckConstraint(condition=models.Q(('target_compound', models.F('similar_compound')), _negated=True), name='no_self_similarity', violation_error_message='화합물은 자기 자신과 비교할 수 없습니다.')],
+                'unique_together': {('target_compound', 'similar_compound')},
+            },
+        ),
+    ]
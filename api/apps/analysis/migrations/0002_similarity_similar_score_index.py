@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analysis', '0001_initial'),
+        ('compounds', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='similarityanalysis',
+            index=models.Index(fields=['similar_compound', '-similarity_score'], name='compound_si_similar_9291bf_idx'),
+        ),
+    ]
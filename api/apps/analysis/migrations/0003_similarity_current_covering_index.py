@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analysis', '0002_similarity_similar_score_index'),
+        ('compounds', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='similarityanalysis',
+            index=models.Index(fields=['is_current', '-similarity_score'], include=('target_compound', 'similar_compound', 'fingerprint_method'), name='sim_current_score_covering'),
+        ),
+    ]
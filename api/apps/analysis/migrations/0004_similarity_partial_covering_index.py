@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analysis', '0003_similarity_current_covering_index'),
+        ('compounds', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='similarityanalysis',
+            name='compound_si_similar_dbb892_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='similarityanalysis',
+            name='sim_current_score_covering',
+        ),
+        migrations.AlterField(
+            model_name='similarityanalysis',
+            name='is_current',
+            field=models.BooleanField(default=True, verbose_name='최신 결과 여부'),
+        ),
+        migrations.AddIndex(
+            model_name='similarityanalysis',
+            index=models.Index(condition=models.Q(('is_current', True)), fields=['-similarity_score'], include=('target_compound', 'similar_compound', 'fingerprint_method'), name='sim_current_score_covering'),
+        ),
+    ]
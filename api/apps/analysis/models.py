@@ -61,7 +61,7 @@ class SimilarityAnalysis(models.Model):
     # 캐시 유효성
     is_current = models.BooleanField(
         default=True,
-        db_index=True,
+        db_index=False,
         verbose_name=_("최신 결과 여부")
     )
 
@@ -73,8 +73,15 @@ class SimilarityAnalysis(models.Model):
         unique_together = ('target_compound', 'similar_compound')
         indexes = [
             models.Index(fields=['target_compound', '-similarity_score']),
-            models.Index(fields=['similarity_score', 'is_current']),
+            models.Index(fields=['similar_compound', '-similarity_score']),
             models.Index(fields=['analysis_date']),
+            # 최신 결과만 담는 부분 커버링 인덱스 (index-only scan)
+            models.Index(
+                fields=['-similarity_score'],
+                condition=models.Q(is_current=True),
+                include=['target_compound', 'similar_compound', 'fingerprint_method'],
+                name='sim_current_score_covering',
+            ),
         ]
         constraints = [
             models.CheckConstraint(
@@ -1,20 +1,61 @@
+import math
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import TYPE_CHECKING, Optional
 
-from django.db.models import Avg, Count, Q, QuerySet
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Avg, Count, F, Q, QuerySet
+
+from apps.core.cache import bump_cache_version, get_cache_version
 
 if TYPE_CHECKING:
     from apps.compounds.models import Compound
 
+# 통계 캐시 키 / TTL
+SIMILARITY_STATS_CACHE_KEY = "similarity:stats:v1"
+SIMILARITY_STATS_CACHE_TIMEOUT = 300
 
-@dataclass
-class SimilarityFilterParams:
-    """유사도 분석 필터링 파라미터"""
-    min_score: Optional[float] = None
-    max_score: Optional[float] = None
-    fingerprint_method: Optional[str] = None
-    is_current: Optional[bool] = None
-    compound_id: Optional[int] = None
+# 유사 화합물 조회 결과의 프로세스 로컬 캐시 (버전 변경 시 자동 무효화)
+SIMILAR_COMPOUNDS_VERSION_KEY = "similarity:similar:version"
+SIMILAR_COMPOUNDS_LRU_SIZE = 4096
+# LRU 키 공간/항목 크기 제한: limit 상한, min_score 반올림 자릿수
+SIMILAR_COMPOUNDS_MAX_LIMIT = 100
+SIMILAR_SCORE_PRECISION = 2
+# 유사 화합물 API 응답의 Cache-Control max-age (초)
+SIMILAR_RESPONSE_MAX_AGE = 60
+
+# 점수 히스토그램 구간 수 (10이면 0.1 단위)
+SCORE_HISTOGRAM_BUCKETS = 10
+# 점수 분포에서 개별 라벨을 붙이는 상위 구간 수 (나머지는 below_* 로 합산)
+SCORE_DISTRIBUTION_TOP_BUCKETS = 3
+
+
+def _format_score(value: float) -> str:
+    """구간 경계 점수 문자열 (0.9, 1.0, 0.95 형식)"""
+    text = f"{value:.2f}".rstrip("0")
+    return text + "0" if text.endswith(".") else text
+
+
+def _distribution_labels() -> tuple[str, ...]:
+    """SCORE_HISTOGRAM_BUCKETS 기준 점수 분포 라벨 (높은 구간부터)"""
+    n = SCORE_HISTOGRAM_BUCKETS
+    labels = [
+        f"{_format_score((b - 1) / n)}_to_{_format_score(b / n)}"
+        for b in range(n, n - SCORE_DISTRIBUTION_TOP_BUCKETS, -1)
+    ]
+    lower = (n - SCORE_DISTRIBUTION_TOP_BUCKETS) / n
+    labels.append(f"below_{_format_score(lower)}")
+    return tuple(labels)
+
+
+SCORE_DISTRIBUTION_LABELS = _distribution_labels()
+
+
+def _bucket_label(bucket: int) -> str:
+    """width_bucket 번호를 점수 분포 라벨로 변환 (1.0은 n+1번 버킷)"""
+    index = SCORE_HISTOGRAM_BUCKETS - min(bucket, SCORE_HISTOGRAM_BUCKETS)
+    return SCORE_DISTRIBUTION_LABELS[min(index, SCORE_DISTRIBUTION_TOP_BUCKETS)]
 
 
 @dataclass
@@ -27,7 +68,7 @@ class SimilarityStatistics:
     method_distribution: dict
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SimilarCompoundResult:
     """유사 화합물 결과"""
     id: int
@@ -41,73 +82,41 @@ class SimilarCompoundResult:
 class SimilarityAnalysisService:
     """유사도 분석 비즈니스 로직 서비스"""
 
-    def filter_analyses(
-        self,
-        queryset: QuerySet,
-        params: SimilarityFilterParams,
-    ) -> QuerySet:
-        """
-        유사도 분석 쿼리셋 필터링
-
-        Args:
-            queryset: 기본 쿼리셋
-            params: 필터링 파라미터
-
-        Returns:
-            필터링된 쿼리셋
-        """
-        if params.min_score is not None:
-            queryset = queryset.filter(similarity_score__gte=params.min_score)
-
-        if params.max_score is not None:
-            queryset = queryset.filter(similarity_score__lte=params.max_score)
-
-        if params.fingerprint_method:
-            queryset = queryset.filter(fingerprint_method=params.fingerprint_method)
-
-        if params.is_current is not None:
-            queryset = queryset.filter(is_current=params.is_current)
-
-        if params.compound_id is not None:
-            queryset = queryset.filter(
-                Q(target_compound_id=params.compound_id) |
-                Q(similar_compound_id=params.compound_id)
-            )
-
-        return queryset
-
     def get_statistics(self) -> SimilarityStatistics:
         """
-        유사도 분석 통계 조회
+        유사도 분석 통계 조회 (캐시 사용)
 
         Returns:
             통계 정보 dataclass
         """
-        from .models import SimilarityAnalysis
+        return cache.get_or_set(
+            SIMILARITY_STATS_CACHE_KEY,
+            self._compute_statistics,
+            SIMILARITY_STATS_CACHE_TIMEOUT,
+        )
+
+    def clear_statistics_cache(self) -> None:
+        """통계 캐시 무효화"""
+        cache.delete(SIMILARITY_STATS_CACHE_KEY)
 
-        total_count = SimilarityAnalysis.objects.count()
-        current_count = SimilarityAnalysis.objects.filter(is_current=True).count()
+    def _compute_statistics(self) -> SimilarityStatistics:
+        """유사도 분석 통계 계산"""
+        from .models import SimilarityAnalysis
 
-        avg_result = SimilarityAnalysis.objects.aggregate(avg=Avg("similarity_score"))
-        average_score = avg_result["avg"] or 0.0
+        # 전체/최신 건수, 평균
+        aggregates = SimilarityAnalysis.objects.aggregate(
+            total=Count("id"),
+            current=Count("id", filter=Q(is_current=True)),
+            avg=Avg("similarity_score"),
+        )
+        average_score = aggregates["avg"] or 0.0
 
         # 유사도 점수 분포
-        score_distribution = {
-            "0.9_to_1.0": SimilarityAnalysis.objects.filter(
-                similarity_score__gte=0.9
-            ).count(),
-            "0.8_to_0.9": SimilarityAnalysis.objects.filter(
-                similarity_score__gte=0.8,
-                similarity_score__lt=0.9
-            ).count(),
-            "0.7_to_0.8": SimilarityAnalysis.objects.filter(
-                similarity_score__gte=0.7,
-                similarity_score__lt=0.8
-            ).count(),
-            "below_0.7": SimilarityAnalysis.objects.filter(
-                similarity_score__lt=0.7
-            ).count(),
-        }
+        score_distribution = dict.fromkeys(SCORE_DISTRIBUTION_LABELS, 0)
+        for bucket, count in self._score_histogram(
+            SimilarityAnalysis._meta.db_table
+        ):
+            score_distribution[_bucket_label(bucket)] += count
 
         # fingerprint 방법별 분포
         method_distribution = list(
@@ -118,13 +127,30 @@ class SimilarityAnalysisService:
         )
 
         return SimilarityStatistics(
-            total_analyses=total_count,
-            current_analyses=current_count,
+            total_analyses=aggregates["total"],
+            current_analyses=aggregates["current"],
             average_score=round(average_score, 4),
             score_distribution=score_distribution,
             method_distribution=method_distribution,
         )
 
+    @staticmethod
+    def _score_histogram(db_table: str) -> list[tuple[int, int]]:
+        """
+        width_bucket 기반 점수 히스토그램 (단일 GROUP BY 스캔)
+
+        Returns:
+            (버킷 번호, 건수) 리스트. SCORE_HISTOGRAM_BUCKETS 구간, 1.0은 n+1번 버킷
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT width_bucket(similarity_score, 0, 1, "
+                f"{SCORE_HISTOGRAM_BUCKETS}) AS bucket, COUNT(*) "
+                f"FROM {connection.ops.quote_name(db_table)} "
+                f"GROUP BY bucket ORDER BY bucket"
+            )
+            return cursor.fetchall()
+
     def get_similar_compounds(
         self,
         compound: "Compound",
@@ -136,6 +162,29 @@ class SimilarityAnalysisService:
 
         Args:
             compound: 대상 화합물 객체
+            min_score: 최소 유사도 점수 (소수 둘째 자리로 반올림)
+            limit: 결과 수 제한 (최대 SIMILAR_COMPOUNDS_MAX_LIMIT)
+
+        Returns:
+            유사 화합물 리스트
+        """
+        min_score, limit = _normalize_similar_params(min_score, limit)
+        version = get_cache_version(SIMILAR_COMPOUNDS_VERSION_KEY)
+        return list(
+            _cached_similar_compounds(compound.id, min_score, limit, version)
+        )
+
+    def query_similar_compounds(
+        self,
+        compound_id: int,
+        min_score: float,
+        limit: int,
+    ) -> list[SimilarCompoundResult]:
+        """
+        유사 화합물 목록 DB 조회 (캐시 미사용)
+
+        Args:
+            compound_id: 대상 화합물 ID
             min_score: 최소 유사도 점수
             limit: 결과 수 제한
 
@@ -144,32 +193,69 @@ class SimilarityAnalysisService:
         """
         from .models import SimilarityAnalysis
 
-        similarities = SimilarityAnalysis.objects.filter(
-            Q(target_compound=compound) | Q(similar_compound=compound),
+        # 대상/비교 방향별로 인덱스 범위 스캔 후 UNION ALL (OR 조건 회피)
+        # 모델 인스턴스 생성 없이 튜플로 바로 조회
+        as_target = self._similar_half(
+            SimilarityAnalysis.objects.filter(target_compound_id=compound_id),
+            "similar_compound",
+            min_score,
+            limit,
+        )
+        as_comparison = self._similar_half(
+            SimilarityAnalysis.objects.filter(similar_compound_id=compound_id),
+            "target_compound",
+            min_score,
+            limit,
+        )
+
+        rows = as_target.union(as_comparison, all=True).order_by(
+            "-similarity_score"
+        )[:limit]
+
+        return [
+            SimilarCompoundResult(
+                id=other_id,
+                standard_name=other_name,
+                cid=other_cid,
+                molecular_formula=other_formula,
+                similarity_score=similarity_score,
+                fingerprint_method=fingerprint_method,
+            )
+            for (
+                similarity_score,
+                fingerprint_method,
+                other_id,
+                other_name,
+                other_cid,
+                other_formula,
+            ) in rows
+        ]
+
+    @staticmethod
+    def _similar_half(
+        queryset: QuerySet,
+        other: str,
+        min_score: float,
+        limit: int,
+    ) -> QuerySet:
+        """한 방향(대상 또는 비교)의 유사 화합물 튜플 쿼리셋"""
+        return queryset.filter(
             similarity_score__gte=min_score,
             is_current=True,
-        ).select_related(
-            "target_compound", "similar_compound"
+        ).annotate(
+            other_id=F(f"{other}_id"),
+            other_name=F(f"{other}__standard_name"),
+            other_cid=F(f"{other}__cid"),
+            other_formula=F(f"{other}__molecular_formula"),
+        ).values_list(
+            "similarity_score",
+            "fingerprint_method",
+            "other_id",
+            "other_name",
+            "other_cid",
+            "other_formula",
         ).order_by("-similarity_score")[:limit]
 
-        results = []
-        for sim in similarities:
-            if sim.target_compound_id == compound.id:
-                other = sim.similar_compound
-            else:
-                other = sim.target_compound
-
-            results.append(SimilarCompoundResult(
-                id=other.id,
-                standard_name=other.standard_name,
-                cid=other.cid,
-                molecular_formula=other.molecular_formula,
-                similarity_score=sim.similarity_score,
-                fingerprint_method=sim.fingerprint_method,
-            ))
-
-        return results
-
     def invalidate_compound_similarities(
         self,
         compound_id: int,
@@ -185,12 +271,51 @@ class SimilarityAnalysisService:
         """
         from .models import SimilarityAnalysis
 
-        updated = SimilarityAnalysis.objects.filter(
-            Q(target_compound_id=compound_id) | Q(similar_compound_id=compound_id),
-            is_current=True,
-        ).update(is_current=False)
+        # 방향별 단일 인덱스 범위 UPDATE (OR 조건의 seq scan 회피)
+        with transaction.atomic():
+            updated_as_target = SimilarityAnalysis.objects.filter(
+                target_compound_id=compound_id,
+                is_current=True,
+            ).update(is_current=False)
+            updated_as_comparison = SimilarityAnalysis.objects.filter(
+                similar_compound_id=compound_id,
+                is_current=True,
+            ).update(is_current=False)
+
+        updated = updated_as_target + updated_as_comparison
+
+        self.clear_statistics_cache()
+        self.clear_similar_compounds_cache()
 
         return updated
 
+    def clear_similar_compounds_cache(self) -> None:
+        """유사 화합물 조회 캐시 무효화 (모든 프로세스의 LRU 항목 폐기)"""
+        bump_cache_version(SIMILAR_COMPOUNDS_VERSION_KEY)
+
+
+similarity_analysis_service = SimilarityAnalysisService()
 
-similarity_analysis_service = SimilarityAnalysisService()
\ No newline at end of file
+
+def _normalize_similar_params(min_score: float, limit: int) -> tuple[float, int]:
+    """LRU 캐시 키용 파라미터 정규화 (limit 1~상한, min_score 0~1 반올림)"""
+    if not math.isfinite(min_score):
+        min_score = 0.0
+    min_score = round(min(max(min_score, 0.0), 1.0), SIMILAR_SCORE_PRECISION)
+    limit = min(max(limit, 1), SIMILAR_COMPOUNDS_MAX_LIMIT)
+    return min_score, limit
+
+
+@lru_cache(maxsize=SIMILAR_COMPOUNDS_LRU_SIZE)
+def _cached_similar_compounds(
+    compound_id: int,
+    min_score: float,
+    limit: int,
+    version: int,
+) -> tuple[SimilarCompoundResult, ...]:
+    """버전 키를 포함한 유사 화합물 조회 결과 캐시 (version은 캐시 키 용도)"""
+    return tuple(
+        similarity_analysis_service.query_similar_compounds(
+            compound_id, min_score, limit
+        )
+    )
\ No newline at end of file
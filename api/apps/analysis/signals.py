@@ -0,0 +1,20 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import SimilarityAnalysis
+from .services import similarity_analysis_service
+
+
+@receiver(post_save, sender=SimilarityAnalysis)
+@receiver(post_delete, sender=SimilarityAnalysis)
+def clear_similarity_statistics(sender, instance, **kwargs):
+    """유사도 분석 변경 시 통계 / 유사 화합물 캐시 무효화"""
+    similarity_analysis_service.clear_statistics_cache()
+    similarity_analysis_service.clear_similar_compounds_cache()
+
+
+@receiver(post_save, sender="compounds.Compound")
+@receiver(post_delete, sender="compounds.Compound")
+def clear_similar_compounds(sender, instance, **kwargs):
+    """화합물 정보 변경 시 유사 화합물 캐시 무효화 (결과에 이름/CID 포함)"""
+    similarity_analysis_service.clear_similar_compounds_cache()
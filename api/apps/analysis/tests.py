@@ -1,3 +1,64 @@
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 
-# Create your tests here.
+from apps.compounds.models import Compound
+
+from .models import SimilarityAnalysis
+from .services import (
+    SCORE_DISTRIBUTION_LABELS,
+    _bucket_label,
+    similarity_analysis_service,
+)
+
+
+class BucketLabelTests(SimpleTestCase):
+    """width_bucket 번호 → 점수 분포 라벨"""
+
+    def test_labels(self):
+        self.assertEqual(
+            SCORE_DISTRIBUTION_LABELS,
+            ("0.9_to_1.0", "0.8_to_0.9", "0.7_to_0.8", "below_0.7"),
+        )
+
+    def test_bucket_mapping(self):
+        expected = {
+            0: "below_0.7",
+            1: "below_0.7",
+            7: "below_0.7",
+            8: "0.7_to_0.8",
+            9: "0.8_to_0.9",
+            10: "0.9_to_1.0",
+            11: "0.9_to_1.0",  # score == 1.0
+        }
+        for bucket, label in expected.items():
+            with self.subTest(bucket=bucket):
+                self.assertEqual(_bucket_label(bucket), label)
+
+
+class ScoreDistributionTests(TestCase):
+    """통계의 점수 분포 (width_bucket 히스토그램)"""
+
+    SCORES = (1.0, 0.95, 0.9, 0.85, 0.7, 0.69, 0.2)
+
+    @classmethod
+    def setUpTestData(cls):
+        target = Compound.objects.create(standard_name="target")
+        for i, score in enumerate(cls.SCORES):
+            SimilarityAnalysis.objects.create(
+                target_compound=target,
+                similar_compound=Compound.objects.create(standard_name=f"c{i}"),
+                similarity_score=score,
+            )
+
+    def test_score_distribution(self):
+        stats = similarity_analysis_service._compute_statistics()
+
+        self.assertEqual(stats.total_analyses, len(self.SCORES))
+        self.assertEqual(
+            stats.score_distribution,
+            {
+                "0.9_to_1.0": 3,
+                "0.8_to_0.9": 1,
+                "0.7_to_0.8": 1,
+                "below_0.7": 2,
+            },
+        )
@@ -1,18 +1,38 @@
-from dataclasses import asdict
-
+from django_filters.rest_framework import DjangoFilterBackend
+from django.utils.cache import patch_cache_control
 from rest_framework import viewsets, filters, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
+from apps.core.pagination import EstimatedCountPagination
+
+from .filters import SimilarityAnalysisFilter
 from .models import SimilarityAnalysis
 from .serializers import (
     SimilarityAnalysisListSerializer,
     SimilarityAnalysisDetailSerializer,
     SimilarityAnalysisCreateSerializer,
 )
-from .services import (
-    similarity_analysis_service,
-    SimilarityFilterParams,
+from .services import SIMILAR_RESPONSE_MAX_AGE, similarity_analysis_service
+
+# 목록/상세 Serializer가 실제로 사용하는 컬럼만 조회
+SIMILARITY_ONLY_FIELDS = (
+    "id",
+    "similarity_score",
+    "fingerprint_method",
+    "similarity_metric",
+    "is_current",
+    "analysis_date",
+    "target_compound",
+    "target_compound__id",
+    "target_compound__standard_name",
+    "target_compound__cid",
+    "target_compound__molecular_formula",
+    "similar_compound",
+    "similar_compound__id",
+    "similar_compound__standard_name",
+    "similar_compound__cid",
+    "similar_compound__molecular_formula",
 )
 
 
@@ -29,47 +49,17 @@ class SimilarityAnalysisViewSet(viewsets.ModelViewSet):
     queryset = SimilarityAnalysis.objects.select_related(
         "target_compound", "similar_compound"
     )
-    filter_backends = [filters.OrderingFilter]
+    pagination_class = EstimatedCountPagination
+    filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
+    filterset_class = SimilarityAnalysisFilter
     ordering_fields = ["similarity_score", "analysis_date"]
     ordering = ["-similarity_score"]
 
     def get_queryset(self):
         """
-        쿼리셋 필터링
+        쿼리셋 컬럼 최적화 (필터링은 SimilarityAnalysisFilter에서 처리)
         """
-        queryset = super().get_queryset()
-
-        filter_params = self._build_filter_params()
-        queryset = similarity_analysis_service.filter_analyses(
-            queryset, filter_params
-        )
-
-        return queryset
-
-    def _build_filter_params(self) -> SimilarityFilterParams:
-        """쿼리 파라미터를 SimilarityFilterParams로 변환"""
-        params = self.request.query_params
-
-        min_score = params.get("min_score")
-        max_score = params.get("max_score")
-        fingerprint_method = params.get("fingerprint_method")
-        is_current = params.get("is_current")
-        compound_id = params.get("compound_id")
-
-        return SimilarityFilterParams(
-            min_score=float(min_score) if min_score else None,
-            max_score=float(max_score) if max_score else None,
-            fingerprint_method=fingerprint_method,
-            is_current=self._parse_bool(is_current),
-            compound_id=int(compound_id) if compound_id else None,
-        )
-
-    @staticmethod
-    def _parse_bool(value: str | None) -> bool | None:
-        """문자열을 bool로 변환"""
-        if value is None:
-            return None
-        return value.lower() in ["true", "1", "yes"]
+        return super().get_queryset().only(*SIMILARITY_ONLY_FIELDS)
 
     def get_serializer_class(self):
         """
@@ -91,7 +81,7 @@ class SimilarityAnalysisViewSet(viewsets.ModelViewSet):
         GET /api/analysis/similarities/statistics/
         """
         stats = similarity_analysis_service.get_statistics()
-        return Response(asdict(stats))
+        return Response(stats)
 
     @action(detail=False, methods=["get"])
     def by_compound(self, request):
@@ -103,7 +93,7 @@ class SimilarityAnalysisViewSet(viewsets.ModelViewSet):
         Query Parameters:
         - compound_id: 화합물 ID (필수)
         - min_score: 최소 유사도 점수 (기본값: 0.7)
-        - limit: 결과 수 제한 (기본값: 10)
+        - limit: 결과 수 제한 (기본값: 10, 최대: 100)
         """
         compound_id = request.query_params.get("compound_id")
 
@@ -146,13 +136,17 @@ class SimilarityAnalysisViewSet(viewsets.ModelViewSet):
             compound, min_score, limit
         )
 
-        return Response({
+        response = Response({
             "compound_id": compound.id,
             "compound_name": compound.standard_name,
             "min_score": min_score,
             "count": len(similar_compounds),
-            "similar_compounds": [asdict(s) for s in similar_compounds],
+            # dataclass는 ORJSONRenderer가 C 레벨에서 직접 직렬화
+            "similar_compounds": similar_compounds,
         })
+        # 무효화가 바로 반영되도록 공유 캐시는 제외하고 브라우저에만 단기 캐시
+        patch_cache_control(response, private=True, max_age=SIMILAR_RESPONSE_MAX_AGE)
+        return response
 
     @action(detail=False, methods=["post"])
     def invalidate(self, request):
@@ -1,20 +1,20 @@
 from django.contrib import admin
-from .models import Compound
+from .models import Compound, CompoundFingerprint
 
 
 @admin.register(Compound)
 class CompoundAdmin(admin.ModelAdmin):
     list_display = ['standard_name', 'cid', 'molecular_formula', 'molecular_weight', 'is_valid', 'updated_at']
-    list_filter = ['is_valid', 'fingerprint_type']
+    list_filter = ['is_valid', 'has_structure', 'fp__fingerprint_type']
     search_fields = ['standard_name', 'cid', 'molecular_formula']
-    readonly_fields = ['created_at', 'updated_at', 'pubchem_last_fetched']
+    readonly_fields = ['has_structure', 'created_at', 'updated_at', 'pubchem_last_fetched']
 
     fieldsets = (
         ('기본 정보', {
             'fields': ('standard_name', 'cid')
         }),
         ('구조 정보', {
-            'fields': ('smiles', 'inchi', 'inchi_key', 'fingerprint_type'),
+            'fields': ('smiles', 'inchi', 'inchi_key', 'has_structure'),
         }),
         ('물성 정보', {
             'fields': ('molecular_formula', 'molecular_weight', 'iupac_name')
@@ -26,4 +26,12 @@ class CompoundAdmin(admin.ModelAdmin):
             'fields': ('created_at', 'updated_at', 'pubchem_last_fetched'),
             'classes': ('collapse',)
         }),
-    )
\ No newline at end of file
+    )
+
+
+@admin.register(CompoundFingerprint)
+class CompoundFingerprintAdmin(admin.ModelAdmin):
+    list_display = ['compound', 'fingerprint_type']
+    list_filter = ['fingerprint_type']
+    search_fields = ['compound__standard_name']
+    raw_id_fields = ['compound']
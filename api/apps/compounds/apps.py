@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class CompoundsConfig(AppConfig):
     name = 'apps.compounds'
+
+    def ready(self):
+        from . import signals  # noqa: F401
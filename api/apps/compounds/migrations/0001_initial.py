@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Compound',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('standard_name', models.CharField(db_index=True, max_length=255, unique=True, verbose_name='표준 성분명')),
+                ('cid', models.BigIntegerField(blank=True, db_index=True, null=True, unique=True, verbose_name='PubChem CID')),
+                ('smiles', models.TextField(blank=True, null=True, verbose_name='Canonical SMILES')),
+                ('inchi', models.TextField(blank=True, null=True, verbose_name='InChI')),
+                ('inchi_key', models.CharField(blank=True, db_index=True, max_length=27, null=True, verbose_name='InChI Key')),
+                ('molecular_formula', models.CharField(blank=True, max_length=100, null=True, verbose_name='분자식')),
+                ('molecular_weight', models.DecimalField(blank=True, decimal_places=4, max_digits=12, null=True, verbose_name='분자량')),
+                ('iupac_name', models.TextField(blank=True, null=True, verbose_name='IUPAC 명칭')),
+                ('fingerprint_morgan', models.BinaryField(blank=True, null=True, verbose_name='Morgan Fingerprint')),
+                ('fingerprint_type', models.CharField(default='Morgan_r2_2048', max_length=50, verbose_name='지문 타입')),
+                ('is_valid', models.BooleanField(db_index=True, default=True, verbose_name='유효성 여부')),
+                ('validation_error', models.TextField(blank=True, null=True, verbose_name='검증 오류 메시지')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, db_index=True)),
+                ('pubchem_last_fetched', models.DateTimeField(blank=True, null=True, verbose_name='PubChem 최종 조회 시각')),
+            ],
+            options={
+                'verbose_name': '화합물',
+                'verbose_name_plural': '화합물 목록',
+                'db_table': 'compounds',
+                'indexes': [models.Index(fields=['is_valid', 'updated_at'], name='compounds_is_vali_19b77a_idx'), models.Index(fields=['molecular_weight'], name='compounds_molecul_378334_idx')],
+            },
+        ),
+    ]
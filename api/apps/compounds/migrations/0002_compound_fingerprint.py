@@ -0,0 +1,48 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:19
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('compounds', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CompoundFingerprint',
+            fields=[
+                ('compound', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='fp', serialize=False, to='compounds.compound', verbose_name='화합물')),
+                ('data', models.BinaryField(verbose_name='Morgan Fingerprint')),
+                ('fingerprint_type', models.CharField(default='Morgan_r2_2048', max_length=50, verbose_name='지문 타입')),
+            ],
+            options={
+                'verbose_name': '분자 지문',
+                'verbose_name_plural': '분자 지문 목록',
+                'db_table': 'compound_fingerprints',
+            },
+        ),
+        # 기존 fingerprint_morgan 데이터를 1:1 테이블로 복사한 뒤 컬럼 삭제
+        migrations.RunSQL(
+            sql=(
+                "INSERT INTO compound_fingerprints (compound_id, data, fingerprint_type) "
+                "SELECT id, fingerprint_morgan, COALESCE(fingerprint_type, 'Morgan_r2_2048') "
+                "FROM compounds WHERE fingerprint_morgan IS NOT NULL"
+            ),
+            reverse_sql=(
+                "UPDATE compounds SET fingerprint_morgan = f.data, "
+                "fingerprint_type = f.fingerprint_type "
+                "FROM compound_fingerprints f WHERE f.compound_id = compounds.id"
+            ),
+        ),
+        migrations.RemoveField(
+            model_name='compound',
+            name='fingerprint_morgan',
+        ),
+        migrations.RemoveField(
+            model_name='compound',
+            name='fingerprint_type',
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:19
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+import django.db.models.functions.text
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('compounds', '0002_compound_fingerprint'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='compound',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('standard_name'), name='gin_trgm_ops'), name='cmp_name_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='compound',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('iupac_name'), name='gin_trgm_ops'), name='cmp_iupac_trgm_idx'),
+        ),
+    ]
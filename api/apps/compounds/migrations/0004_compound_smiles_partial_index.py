@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('compounds', '0003_compound_name_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='compound',
+            index=models.Index(condition=models.Q(('smiles__isnull', False), models.Q(('smiles', ''), _negated=True)), fields=['id'], name='cmp_has_smiles_idx'),
+        ),
+    ]
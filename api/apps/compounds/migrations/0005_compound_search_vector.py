@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:19
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('compounds', '0004_compound_smiles_partial_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='compound',
+            name='search_vector',
+            field=models.GeneratedField(db_persist=True, expression=django.contrib.postgres.search.SearchVector('standard_name', 'iupac_name', 'molecular_formula', config='simple'), output_field=django.contrib.postgres.search.SearchVectorField()),
+        ),
+        migrations.AddIndex(
+            model_name='compound',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='cmp_search_gin'),
+        ),
+    ]
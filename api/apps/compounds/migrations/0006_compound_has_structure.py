@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('compounds', '0005_compound_search_vector'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='compound',
+            name='cmp_has_smiles_idx',
+        ),
+        migrations.AddField(
+            model_name='compound',
+            name='has_structure',
+            field=models.BooleanField(db_index=True, default=False, editable=False, verbose_name='구조 데이터 보유 여부'),
+        ),
+        migrations.RunSQL(
+            sql=(
+                "UPDATE compounds SET has_structure = COALESCE(smiles, '') <> '' "
+                "AND EXISTS (SELECT 1 FROM compound_fingerprints f "
+                "WHERE f.compound_id = compounds.id)"
+            ),
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -1,4 +1,7 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils.translation import gettext_lazy as _
 
 
@@ -70,16 +73,12 @@ class Compound(models.Model):
         verbose_name=_("IUPAC 명칭")
     )
 
-    # 지문(Fingerprint) 캐싱
-    fingerprint_morgan = models.BinaryField(
-        null=True,
-        blank=True,
-        verbose_name=_("Morgan Fingerprint")
-    )
-    fingerprint_type = models.CharField(
-        max_length=50,
-        default='Morgan_r2_2048',
-        verbose_name=_("지문 타입")
+    # 구조 분석 가능 여부 (SMILES + fingerprint 보유, 시그널로 갱신)
+    has_structure = models.BooleanField(
+        default=False,
+        db_index=True,
+        editable=False,
+        verbose_name=_("구조 데이터 보유 여부")
     )
 
     # 데이터 품질 관리
@@ -106,6 +105,16 @@ class Compound(models.Model):
         verbose_name=_("PubChem 최종 조회 시각")
     )
 
+    # 전문 검색용 tsvector (DB에서 자동 계산)
+    search_vector = models.GeneratedField(
+        expression=SearchVector(
+            'standard_name', 'iupac_name', 'molecular_formula',
+            config='simple',
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
     class Meta:
         app_label = 'compounds'
         db_table = 'compounds'
@@ -114,12 +123,66 @@ class Compound(models.Model):
         indexes = [
             models.Index(fields=['is_valid', 'updated_at']),
             models.Index(fields=['molecular_weight']),
+            # icontains(UPPER(col) LIKE UPPER(%s)) 검색용 trigram 인덱스 (pg_trgm 필요)
+            GinIndex(
+                OpClass(Upper('standard_name'), name='gin_trgm_ops'),
+                name='cmp_name_trgm_idx',
+            ),
+            GinIndex(
+                OpClass(Upper('iupac_name'), name='gin_trgm_ops'),
+                name='cmp_iupac_trgm_idx',
+            ),
+            GinIndex(fields=['search_vector'], name='cmp_search_gin'),
         ]
 
     def __str__(self):
         cid_info = f"CID:{self.cid}" if self.cid else "CID:N/A"
         return f"{self.standard_name} ({cid_info})"
 
+    def save(self, **kwargs):
+        # pre_save 시그널이 계산한 has_structure가 부분 저장에서도 반영되도록 추가
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'smiles', 'inchi'} & set(update_fields):
+            kwargs['update_fields'] = {*update_fields, 'has_structure'}
+        super().save(**kwargs)
+
     def has_structure_data(self):
-        """구조 분석 가능 여부"""
-        return bool(self.smiles and self.fingerprint_morgan)
\ No newline at end of file
+        """구조 분석 가능 여부 (has_structure 컬럼 값)"""
+        return self.has_structure
+
+    def fingerprint_exists(self):
+        """분자 지문 존재 여부"""
+        return hasattr(self, 'fp')
+
+
+class CompoundFingerprint(models.Model):
+    """
+    화합물 분자 지문(Fingerprint) 캐시
+
+    compounds 행을 좁게 유지하기 위해 BYTEA 데이터를 1:1 테이블로 분리
+    """
+
+    compound = models.OneToOneField(
+        Compound,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='fp',
+        verbose_name=_("화합물")
+    )
+    data = models.BinaryField(
+        verbose_name=_("Morgan Fingerprint")
+    )
+    fingerprint_type = models.CharField(
+        max_length=50,
+        default='Morgan_r2_2048',
+        verbose_name=_("지문 타입")
+    )
+
+    class Meta:
+        app_label = 'compounds'
+        db_table = 'compound_fingerprints'
+        verbose_name = _("분자 지문")
+        verbose_name_plural = _("분자 지문 목록")
+
+    def __str__(self):
+        return f"{self.compound_id} ({self.fingerprint_type})"
\ No newline at end of file
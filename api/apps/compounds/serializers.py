@@ -1,12 +1,49 @@
+import re
+
+from django.db import transaction
+from django.db.models import Q
 from rest_framework import serializers
+from rest_framework.validators import UniqueValidator
+
+from .models import Compound, CompoundFingerprint
+from .services import compound_service
+
+# SMILES 허용 문자 (RDKit 없이 하는 기본 검증)
+SMILES_ALLOWED_CHARS = "CNOPSFIBrcnopsfibl0123456789=#@+\\/-[]().%*"
+_SMILES_PATTERN = re.compile(f"[{re.escape(SMILES_ALLOWED_CHARS)}]*")
+
+# 상세 조회 시 노출할 관련 제품 최대 개수
+RELATED_PRODUCTS_LIMIT = 10
 
-from .models import Compound
+# 대량 생성 시 INSERT 배치 크기
+BULK_CREATE_BATCH_SIZE = 500
+
+# 중복 검증 (DB unique 제약 기반, 수정 시 자기 자신 자동 제외)
+UNIQUE_COMPOUND_EXTRA_KWARGS = {
+    "standard_name": {
+        "validators": [
+            UniqueValidator(
+                queryset=Compound.objects.all(),
+                message="이미 존재하는 표준 성분명입니다.",
+            )
+        ]
+    },
+    "cid": {
+        "validators": [
+            UniqueValidator(
+                queryset=Compound.objects.all(),
+                message="이미 존재하는 CID입니다.",
+            )
+        ]
+    },
+}
 
 
 class CompoundListSerializer(serializers.ModelSerializer):
     """화합물 목록 조회용 시리얼라이저"""
 
-    has_structure = serializers.SerializerMethodField(
+    has_structure = serializers.BooleanField(
+        read_only=True,
         help_text="구조 데이터 존재 여부"
     )
     product_count = serializers.SerializerMethodField(
@@ -28,12 +65,12 @@ class CompoundListSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["id", "created_at"]
 
-    def get_has_structure(self, obj):
-        """구조 데이터 존재 여부"""
-        return obj.has_structure_data()
-
     def get_product_count(self, obj):
         """화합물이 포함된 제품 수 (주성분 기준)"""
+        # 목록 쿼리셋의 annotate 값 우선 사용 (N+1 방지)
+        product_count = getattr(obj, "product_count", None)
+        if product_count is not None:
+            return product_count
         return obj.products.filter(is_main_active=True).count()
 
 
@@ -43,6 +80,9 @@ class CompoundDetailSerializer(serializers.ModelSerializer):
     related_products = serializers.SerializerMethodField(
         help_text="화합물 포함 제품 목록 (최대 10개)"
     )
+    fingerprint_type = serializers.SerializerMethodField(
+        help_text="분자 지문 타입"
+    )
     has_fingerprint = serializers.SerializerMethodField(
         help_text="분자 지문 데이터 존재 여부"
     )
@@ -74,7 +114,6 @@ class CompoundDetailSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = [
             "id",
-            "fingerprint_type",
             "validation_error",
             "is_valid",
             "created_at",
@@ -84,7 +123,11 @@ class CompoundDetailSerializer(serializers.ModelSerializer):
 
     def get_related_products(self, obj):
         """화합물이 포함된 제품 목록 (최대 10개)"""
-        product_ingredients = obj.products.select_related("product")[:10]
+        product_ingredients = getattr(obj, "top_products", None)
+        if product_ingredients is None:
+            product_ingredients = obj.products.select_related(
+                "product"
+            ).order_by("id")[:RELATED_PRODUCTS_LIMIT]
         return [
             {
                 "id": pi.product.id,
@@ -94,15 +137,24 @@ class CompoundDetailSerializer(serializers.ModelSerializer):
             for pi in product_ingredients
         ]
 
+    def get_fingerprint_type(self, obj):
+        """분자 지문 타입 (지문이 없으면 모델 기본값)"""
+        fingerprint = getattr(obj, "fp", None)
+        if fingerprint is not None:
+            return fingerprint.fingerprint_type
+        return CompoundFingerprint._meta.get_field("fingerprint_type").default
+
     def get_has_fingerprint(self, obj):
         """분자 지문 존재 여부"""
-        return obj.fingerprint_morgan is not None
+        return obj.fingerprint_exists()
 
     def get_similarity_count(self, obj):
         """유사도 분석 결과 수 (대상 + 비교 합계)"""
-        target_count = obj.similarities_as_target.count()
-        comparison_count = obj.similarities_as_comparison.count()
-        return target_count + comparison_count
+        from apps.analysis.models import SimilarityAnalysis
+
+        return SimilarityAnalysis.objects.filter(
+            Q(target_compound_id=obj.id) | Q(similar_compound_id=obj.id)
+        ).count()
 
 
 class CompoundCreateSerializer(serializers.ModelSerializer):
@@ -120,13 +172,10 @@ class CompoundCreateSerializer(serializers.ModelSerializer):
             "molecular_weight",
             "iupac_name",
         ]
+        extra_kwargs = UNIQUE_COMPOUND_EXTRA_KWARGS
 
     def validate_standard_name(self, value):
         """표준 성분명 유효성 검증"""
-        if Compound.objects.filter(standard_name=value).exists():
-            raise serializers.ValidationError(
-                f"이미 존재하는 표준 성분명입니다: {value}"
-            )
         if len(value) < 2:
             raise serializers.ValidationError(
                 "표준 성분명은 최소 2자 이상이어야 합니다."
@@ -137,10 +186,6 @@ class CompoundCreateSerializer(serializers.ModelSerializer):
         """PubChem CID 유효성 검증"""
         if value is None:
             return value
-        if Compound.objects.filter(cid=value).exists():
-            raise serializers.ValidationError(
-                f"이미 존재하는 CID입니다: {value}"
-            )
         if value <= 0:
             raise serializers.ValidationError(
                 "CID는 양의 정수여야 합니다."
@@ -152,11 +197,8 @@ class CompoundCreateSerializer(serializers.ModelSerializer):
         if value is None or value == "":
             return value
         # 기본적인 SMILES 문자 검증 (RDKit 없이)
-        invalid_chars = set(value) - set(
-            "CNOPSFIBrcnopsfibl0123456789"
-            "=#@+\\/-[]().%*"
-        )
-        if invalid_chars:
+        if not _SMILES_PATTERN.fullmatch(value):
+            invalid_chars = set(value) - set(SMILES_ALLOWED_CHARS)
             raise serializers.ValidationError(
                 f"유효하지 않은 SMILES 문자가 포함되어 있습니다: {invalid_chars}"
             )
@@ -178,26 +220,7 @@ class CompoundUpdateSerializer(serializers.ModelSerializer):
             "molecular_weight",
             "iupac_name",
         ]
-
-    def validate_standard_name(self, value):
-        """표준 성분명 중복 검증 (자기 자신 제외)"""
-        instance = self.instance
-        if Compound.objects.filter(standard_name=value).exclude(pk=instance.pk).exists():
-            raise serializers.ValidationError(
-                f"이미 존재하는 표준 성분명입니다: {value}"
-            )
-        return value
-
-    def validate_cid(self, value):
-        """CID 중복 검증 (자기 자신 제외)"""
-        if value is None:
-            return value
-        instance = self.instance
-        if Compound.objects.filter(cid=value).exclude(pk=instance.pk).exists():
-            raise serializers.ValidationError(
-                f"이미 존재하는 CID입니다: {value}"
-            )
-        return value
+        extra_kwargs = UNIQUE_COMPOUND_EXTRA_KWARGS
 
 
 class CompoundSearchSerializer(serializers.ModelSerializer):
@@ -262,8 +285,11 @@ class CompoundBulkCreateSerializer(serializers.Serializer):
 
     def create(self, validated_data):
         compounds_data = validated_data.get("compounds", [])
-        created = []
-        for compound_data in compounds_data:
-            compound = Compound.objects.create(**compound_data)
-            created.append(compound)
+        compounds = [Compound(**compound_data) for compound_data in compounds_data]
+        with transaction.atomic():
+            created = Compound.objects.bulk_create(
+                compounds, batch_size=BULK_CREATE_BATCH_SIZE
+            )
+        # bulk_create는 post_save 시그널을 보내지 않으므로 직접 무효화
+        compound_service.clear_statistics_cache()
         return created
\ No newline at end of file
@@ -1,12 +1,20 @@
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Optional
 
-from django.db.models import Q, QuerySet
+from django.core.cache import cache
+from django.db.models import Case, Count, IntegerField, Q, QuerySet, Value, When
 
 if TYPE_CHECKING:
     from .models import Compound
     from apps.analysis.services import SimilarCompoundResult
 
+# 통계 캐시 키 / TTL
+COMPOUND_STATS_CACHE_KEY = "compound:stats:v1"
+COMPOUND_STATS_CACHE_TIMEOUT = 300
+
+# 화합물 포함 제품 조회 시 DB 커서 fetch 크기
+PRODUCT_ITERATOR_CHUNK_SIZE = 500
+
 
 @dataclass
 class CompoundFilterParams:
@@ -29,16 +37,16 @@ class CompoundStatistics:
     weight_distribution: dict
 
 
-@dataclass
-class CompoundProductInfo:
-    """화합물 포함 제품 정보"""
-    id: int
-    product_name: str
-    permit_number: str
-    manufacturer: Optional[str]
-    is_main_active: bool
-    content: Optional[str]
-    unit: Optional[str]
+# 화합물 포함 제품 응답 키 (values_list 컬럼 순서와 동일)
+COMPOUND_PRODUCT_KEYS = (
+    "id",
+    "product_name",
+    "permit_number",
+    "manufacturer",
+    "is_main_active",
+    "content",
+    "unit",
+)
 
 
 class CompoundService:
@@ -63,16 +71,7 @@ class CompoundService:
             queryset = queryset.filter(is_valid=params.is_valid)
 
         if params.has_structure is not None:
-            if params.has_structure:
-                queryset = queryset.filter(
-                    smiles__isnull=False,
-                    fingerprint_morgan__isnull=False
-                ).exclude(smiles="")
-            else:
-                queryset = queryset.filter(
-                    Q(smiles__isnull=True) | Q(smiles="") |
-                    Q(fingerprint_morgan__isnull=True)
-                )
+            queryset = queryset.filter(has_structure=params.has_structure)
 
         if params.has_cid is not None:
             if params.has_cid:
@@ -90,42 +89,58 @@ class CompoundService:
 
     def get_statistics(self) -> CompoundStatistics:
         """
-        화합물 전체 통계 조회
+        화합물 전체 통계 조회 (캐시 사용)
 
         Returns:
             통계 정보 dataclass
         """
-        from .models import Compound
+        return cache.get_or_set(
+            COMPOUND_STATS_CACHE_KEY,
+            self._compute_statistics,
+            COMPOUND_STATS_CACHE_TIMEOUT,
+        )
 
-        total_count = Compound.objects.count()
-        valid_count = Compound.objects.filter(is_valid=True).count()
+    def clear_statistics_cache(self) -> None:
+        """통계 캐시 무효화"""
+        cache.delete(COMPOUND_STATS_CACHE_KEY)
 
-        with_cid_count = Compound.objects.filter(cid__isnull=False).count()
-        with_structure_count = Compound.objects.filter(
-            smiles__isnull=False,
-            fingerprint_morgan__isnull=False
-        ).exclude(smiles="").count()
+    def _compute_statistics(self) -> CompoundStatistics:
+        """화합물 통계 계산"""
+        from .models import Compound
 
-        weight_distribution = {
-            "under_200": Compound.objects.filter(molecular_weight__lt=200).count(),
-            "200_to_500": Compound.objects.filter(
+        # 전체 건수와 조건별 건수를 단일 집계 쿼리(FILTER 절)로 계산
+        stats = Compound.objects.aggregate(
+            total=Count("id"),
+            valid=Count("id", filter=Q(is_valid=True)),
+            with_cid=Count("id", filter=Q(cid__isnull=False)),
+            with_structure=Count("id", filter=Q(has_structure=True)),
+            w_under_200=Count("id", filter=Q(molecular_weight__lt=200)),
+            w_200_to_500=Count("id", filter=Q(
                 molecular_weight__gte=200,
                 molecular_weight__lt=500
-            ).count(),
-            "500_to_1000": Compound.objects.filter(
+            )),
+            w_500_to_1000=Count("id", filter=Q(
                 molecular_weight__gte=500,
                 molecular_weight__lt=1000
-            ).count(),
-            "over_1000": Compound.objects.filter(molecular_weight__gte=1000).count(),
-            "unknown": Compound.objects.filter(molecular_weight__isnull=True).count(),
+            )),
+            w_over_1000=Count("id", filter=Q(molecular_weight__gte=1000)),
+            w_unknown=Count("id", filter=Q(molecular_weight__isnull=True)),
+        )
+
+        weight_distribution = {
+            "under_200": stats["w_under_200"],
+            "200_to_500": stats["w_200_to_500"],
+            "500_to_1000": stats["w_500_to_1000"],
+            "over_1000": stats["w_over_1000"],
+            "unknown": stats["w_unknown"],
         }
 
         return CompoundStatistics(
-            total_compounds=total_count,
-            valid_compounds=valid_count,
-            invalid_compounds=total_count - valid_count,
-            with_pubchem_cid=with_cid_count,
-            with_structure_data=with_structure_count,
+            total_compounds=stats["total"],
+            valid_compounds=stats["valid"],
+            invalid_compounds=stats["total"] - stats["valid"],
+            with_pubchem_cid=stats["with_cid"],
+            with_structure_data=stats["with_structure"],
             weight_distribution=weight_distribution,
         )
 
@@ -169,19 +184,25 @@ class CompoundService:
             ))
 
         else:  # name (기본)
-            exact_match = queryset.filter(standard_name__iexact=query)
-            partial_match = queryset.filter(
-                Q(standard_name__icontains=query) |
-                Q(iupac_name__icontains=query)
-            ).exclude(standard_name__iexact=query)
-
-            return list(exact_match) + list(partial_match)
+            # 정확히 일치하는 결과를 먼저 정렬 (단일 쿼리)
+            return list(
+                queryset.filter(
+                    Q(standard_name__icontains=query) |
+                    Q(iupac_name__icontains=query)
+                ).annotate(
+                    match_rank=Case(
+                        When(standard_name__iexact=query, then=Value(0)),
+                        default=Value(1),
+                        output_field=IntegerField(),
+                    )
+                ).order_by("match_rank", "standard_name")
+            )
 
     def get_compound_products(
         self,
         compound: "Compound",
         is_main_active: Optional[bool] = None,
-    ) -> list[CompoundProductInfo]:
+    ) -> list[dict]:
         """
         화합물이 포함된 제품 목록 조회
 
@@ -190,9 +211,18 @@ class CompoundService:
             is_main_active: 주성분 여부 필터 (None이면 전체)
 
         Returns:
-            제품 정보 리스트
+            제품 정보 dict 리스트
         """
-        product_ingredients = compound.products.select_related("product")
+        # 모델 인스턴스 생성 없이 튜플로 조회 후 dict 변환
+        product_ingredients = compound.products.values_list(
+            "product_id",
+            "product__product_name",
+            "product__permit_number",
+            "product__manufacturer",
+            "is_main_active",
+            "content",
+            "unit",
+        )
 
         if is_main_active is not None:
             product_ingredients = product_ingredients.filter(
@@ -200,16 +230,11 @@ class CompoundService:
             )
 
         return [
-            CompoundProductInfo(
-                id=pi.product.id,
-                product_name=pi.product.product_name,
-                permit_number=pi.product.permit_number,
-                manufacturer=pi.product.manufacturer,
-                is_main_active=pi.is_main_active,
-                content=pi.content,
-                unit=pi.unit,
+            dict(zip(COMPOUND_PRODUCT_KEYS, row))
+            # 결과 캐시 없이 청크 단위로 스트리밍 (최대 메모리 절감)
+            for row in product_ingredients.iterator(
+                chunk_size=PRODUCT_ITERATOR_CHUNK_SIZE
             )
-            for pi in product_ingredients
         ]
 
     def get_similar_compounds(
@@ -0,0 +1,42 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import Compound, CompoundFingerprint
+from .services import compound_service
+
+
+@receiver(post_save, sender=Compound)
+@receiver(post_delete, sender=Compound)
+@receiver(post_save, sender=CompoundFingerprint)
+@receiver(post_delete, sender=CompoundFingerprint)
+def clear_compound_statistics(sender, instance, **kwargs):
+    """화합물 / 분자 지문 변경 시 통계 캐시 무효화"""
+    compound_service.clear_statistics_cache()
+
+
+@receiver(pre_save, sender=Compound)
+def set_has_structure(sender, instance, **kwargs):
+    """SMILES / fingerprint 보유 여부로 has_structure 갱신"""
+    # 신규 화합물은 fingerprint가 아직 없으므로 조회 생략
+    if not instance.smiles or instance.pk is None:
+        instance.has_structure = False
+        return
+
+    instance.has_structure = CompoundFingerprint.objects.filter(
+        compound_id=instance.pk
+    ).exists()
+
+
+@receiver(post_save, sender=CompoundFingerprint)
+def mark_has_structure(sender, instance, **kwargs):
+    """fingerprint 저장 시 SMILES가 있는 화합물을 구조 보유로 표시"""
+    Compound.objects.filter(
+        pk=instance.compound_id,
+        smiles__isnull=False,
+    ).exclude(smiles="").update(has_structure=True)
+
+
+@receiver(post_delete, sender=CompoundFingerprint)
+def unmark_has_structure(sender, instance, **kwargs):
+    """fingerprint 삭제 시 구조 보유 해제"""
+    Compound.objects.filter(pk=instance.compound_id).update(has_structure=False)
@@ -1,3 +1,63 @@
 from django.test import TestCase
 
-# Create your tests here.
+from .models import Compound, CompoundFingerprint
+
+
+class HasStructureSignalTests(TestCase):
+    """has_structure 컬럼의 시그널 기반 갱신"""
+
+    def _refresh(self, compound):
+        compound.refresh_from_db(fields=["has_structure"])
+        return compound.has_structure
+
+    def test_new_compound_has_no_structure(self):
+        compound = Compound.objects.create(standard_name="aspirin", smiles="CC")
+
+        self.assertFalse(self._refresh(compound))
+
+    def test_fingerprint_with_smiles_sets_structure(self):
+        compound = Compound.objects.create(standard_name="aspirin", smiles="CC")
+        CompoundFingerprint.objects.create(compound=compound, data=b"\x01")
+
+        self.assertTrue(self._refresh(compound))
+
+    def test_fingerprint_without_smiles_keeps_no_structure(self):
+        compound = Compound.objects.create(standard_name="unknown")
+        CompoundFingerprint.objects.create(compound=compound, data=b"\x01")
+
+        self.assertFalse(self._refresh(compound))
+
+    def test_fingerprint_delete_clears_structure(self):
+        compound = Compound.objects.create(standard_name="aspirin", smiles="CC")
+        fingerprint = CompoundFingerprint.objects.create(
+            compound=compound, data=b"\x01"
+        )
+        fingerprint.delete()
+
+        self.assertFalse(self._refresh(compound))
+
+    def test_compound_save_recomputes_structure(self):
+        compound = Compound.objects.create(standard_name="aspirin", smiles="CC")
+        CompoundFingerprint.objects.create(compound=compound, data=b"\x01")
+        compound.refresh_from_db()
+
+        compound.smiles = ""
+        compound.save()
+        self.assertFalse(self._refresh(compound))
+
+        compound.smiles = "CC"
+        compound.save()
+        self.assertTrue(self._refresh(compound))
+
+    def test_partial_save_persists_structure(self):
+        compound = Compound.objects.create(standard_name="aspirin", smiles="CC")
+        CompoundFingerprint.objects.create(compound=compound, data=b"\x01")
+        compound.refresh_from_db()
+
+        compound.smiles = ""
+        compound.save(update_fields=["smiles"])
+        self.assertFalse(self._refresh(compound))
+
+        compound.smiles = "CC"
+        compound.save(update_fields=["smiles"])
+        self.assertTrue(self._refresh(compound))
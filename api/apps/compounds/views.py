@@ -1,9 +1,14 @@
-from dataclasses import asdict
-
 from rest_framework import viewsets, filters, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from django.db.models import Count, Prefetch, Q
+from django.db.models import Count, F, Prefetch, Q, Window
+from django.db.models.functions import RowNumber
+from django.utils.cache import patch_cache_control
+
+from apps.analysis.services import SIMILAR_RESPONSE_MAX_AGE
+from apps.core.filters import SearchVectorFilter
+from apps.core.utils import parse_bool
+from apps.products.models import ProductIngredient
 
 from .models import Compound
 from .serializers import (
@@ -12,12 +17,30 @@ from .serializers import (
     CompoundCreateSerializer,
     CompoundUpdateSerializer,
     CompoundSearchSerializer,
+    RELATED_PRODUCTS_LIMIT,
 )
 from .services import (
     compound_service,
     CompoundFilterParams,
 )
 
+# CompoundFilterParams 필드와 같은 이름의 쿼리 파라미터
+_BOOL_FILTER_PARAMS = ("is_valid", "has_structure", "has_cid")
+_FLOAT_FILTER_PARAMS = ("min_weight", "max_weight")
+
+# 목록 Serializer가 사용하는 컬럼만 조회
+COMPOUND_LIST_ONLY_FIELDS = (
+    "id",
+    "standard_name",
+    "cid",
+    "molecular_formula",
+    "molecular_weight",
+    "has_structure",
+    "is_valid",
+    "created_at",
+    "updated_at",
+)
+
 
 class CompoundViewSet(viewsets.ModelViewSet):
     """
@@ -32,9 +55,12 @@ class CompoundViewSet(viewsets.ModelViewSet):
     """
 
     queryset = Compound.objects.all()
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
-    search_fields = ["standard_name", "cid", "molecular_formula", "iupac_name"]
-    ordering_fields = ["created_at", "updated_at", "standard_name", "molecular_weight"]
+    filter_backends = [SearchVectorFilter, filters.OrderingFilter]
+    search_fields = ("standard_name", "cid", "molecular_formula", "iupac_name")
+    search_vector_field = "search_vector"
+    search_trigram_fields = ("standard_name", "iupac_name")
+    search_exact_fields = ("cid",)
+    ordering_fields = ("created_at", "updated_at", "standard_name", "molecular_weight")
     ordering = ["-created_at"]
 
     def get_queryset(self):
@@ -49,14 +75,37 @@ class CompoundViewSet(viewsets.ModelViewSet):
                 product_count=Count(
                     "products",
                     filter=Q(products__is_main_active=True)
-                )
-            )
+                ),
+            ).only(*COMPOUND_LIST_ONLY_FIELDS)
 
         elif self.action == "retrieve":
-            queryset = queryset.prefetch_related(
+            # 화합물별 상위 10개 제품만 한 번의 쿼리로 prefetch
+            # prefetch 매칭용 compound FK + Serializer가 읽는 컬럼만 조회
+            top_products = ProductIngredient.objects.select_related(
+                "product"
+            ).only(
+                "id",
+                "compound_id",
+                "is_main_active",
+                "product__id",
+                "product__product_name",
+            ).annotate(
+                row_number=Window(
+                    expression=RowNumber(),
+                    partition_by=F("compound_id"),
+                    order_by=F("id").asc(),
+                )
+            ).filter(
+                row_number__lte=RELATED_PRODUCTS_LIMIT
+            ).order_by("id")
+
+            queryset = queryset.select_related("fp").defer(
+                "fp__data"
+            ).prefetch_related(
                 Prefetch(
                     "products",
-                    queryset=Compound.objects.none()
+                    queryset=top_products,
+                    to_attr="top_products",
                 )
             )
 
@@ -70,26 +119,15 @@ class CompoundViewSet(viewsets.ModelViewSet):
         """쿼리 파라미터를 CompoundFilterParams로 변환"""
         params = self.request.query_params
 
-        is_valid = params.get("is_valid")
-        has_structure = params.get("has_structure")
-        has_cid = params.get("has_cid")
-        min_weight = params.get("min_weight")
-        max_weight = params.get("max_weight")
-
-        return CompoundFilterParams(
-            is_valid=self._parse_bool(is_valid),
-            has_structure=self._parse_bool(has_structure),
-            has_cid=self._parse_bool(has_cid),
-            min_weight=float(min_weight) if min_weight else None,
-            max_weight=float(max_weight) if max_weight else None,
-        )
+        filter_values = {
+            key: parse_bool(params.get(key))
+            for key in _BOOL_FILTER_PARAMS
+        }
+        for key in _FLOAT_FILTER_PARAMS:
+            value = params.get(key)
+            filter_values[key] = float(value) if value else None
 
-    @staticmethod
-    def _parse_bool(value: str | None) -> bool | None:
-        """문자열을 bool로 변환"""
-        if value is None:
-            return None
-        return value.lower() in ["true", "1", "yes"]
+        return CompoundFilterParams(**filter_values)
 
     def get_serializer_class(self):
         """
@@ -117,7 +155,7 @@ class CompoundViewSet(viewsets.ModelViewSet):
         GET /api/compounds/statistics/
         """
         stats = compound_service.get_statistics()
-        return Response(asdict(stats))
+        return Response(stats)
 
     @action(detail=False, methods=["get"])
     def search(self, request):
@@ -170,7 +208,7 @@ class CompoundViewSet(viewsets.ModelViewSet):
         """
         compound = self.get_object()
 
-        is_main_active = self._parse_bool(
+        is_main_active = parse_bool(
             request.query_params.get("is_main_active")
         )
 
@@ -182,7 +220,7 @@ class CompoundViewSet(viewsets.ModelViewSet):
             "compound_id": compound.id,
             "compound_name": compound.standard_name,
             "total_products": len(products),
-            "products": [asdict(p) for p in products],
+            "products": products,
         })
 
     @action(detail=True, methods=["get"])
@@ -194,7 +232,7 @@ class CompoundViewSet(viewsets.ModelViewSet):
 
         Query Parameters:
         - min_score: 최소 유사도 점수 (기본값: 0.7)
-        - limit: 결과 수 제한 (기본값: 10)
+        - limit: 결과 수 제한 (기본값: 10, 최대: 100)
         """
         compound = self.get_object()
 
@@ -212,13 +250,17 @@ class CompoundViewSet(viewsets.ModelViewSet):
             compound, min_score, limit
         )
 
-        return Response({
+        response = Response({
             "compound_id": compound.id,
             "compound_name": compound.standard_name,
             "min_score": min_score,
             "count": len(similar_compounds),
-            "similar_compounds": [asdict(s) for s in similar_compounds],
+            # dataclass는 ORJSONRenderer가 C 레벨에서 직접 직렬화
+            "similar_compounds": similar_compounds,
         })
+        # 무효화가 바로 반영되도록 공유 캐시는 제외하고 브라우저에만 단기 캐시
+        patch_cache_control(response, private=True, max_age=SIMILAR_RESPONSE_MAX_AGE)
+        return response
 
     def destroy(self, request, *args, **kwargs):
         """
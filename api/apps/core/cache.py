@@ -0,0 +1,17 @@
+import time
+
+from django.core.cache import cache
+
+
+def get_cache_version(key: str, timeout: int | None = None) -> int:
+    """
+    공유 캐시(Redis)에 저장된 버전 값 조회
+
+    값이 없으면 현재 시각(ns)으로 초기화 (timeout=None이면 만료 없음)
+    """
+    return cache.get_or_set(key, time.time_ns, timeout)
+
+
+def bump_cache_version(key: str, timeout: int | None = None) -> None:
+    """버전 값을 갱신하여 해당 버전에 묶인 캐시를 모두 무효화"""
+    cache.set(key, time.time_ns(), timeout)
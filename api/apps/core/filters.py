@@ -0,0 +1,49 @@
+from django.contrib.postgres.search import SearchQuery
+from django.db.models import Q
+from rest_framework import filters
+
+
+class SearchVectorFilter(filters.SearchFilter):
+    """
+    tsvector(GIN 인덱스) 컬럼 기반 검색 필터
+
+    각 검색어는 tsvector 접두사 일치 또는 trigram 인덱스 컬럼의 부분 일치(icontains)
+    중 하나를 만족해야 함 (모든 조건이 인덱스를 타도록 BitmapOr로 결합)
+
+    View 속성:
+    - search_vector_field: tsvector 컬럼명 (없으면 기본 SearchFilter 동작)
+    - search_trigram_fields: 중간 일치를 허용할 컬럼 (UPPER() gin_trgm_ops 인덱스 필수)
+    - search_exact_fields: 숫자 검색어일 때 정확히 일치 비교할 필드 (예: cid)
+    """
+
+    search_config = "simple"
+
+    def filter_queryset(self, request, queryset, view):
+        vector_field = getattr(view, "search_vector_field", None)
+        search_terms = self.get_search_terms(request)
+
+        if not vector_field or not search_terms:
+            return super().filter_queryset(request, queryset, view)
+
+        trigram_fields = getattr(view, "search_trigram_fields", ())
+
+        # 검색어별 (tsvector 접두사 OR trigram icontains) 조건을 AND 결합
+        condition = Q()
+        for term in search_terms:
+            term_condition = Q(**{vector_field: self._prefix_query(term)})
+            for field in trigram_fields:
+                term_condition |= Q(**{f"{field}__icontains": term})
+            condition &= term_condition
+
+        if len(search_terms) == 1 and search_terms[0].isdigit():
+            for field in getattr(view, "search_exact_fields", ()):
+                condition |= Q(**{field: int(search_terms[0])})
+
+        return queryset.filter(condition)
+
+    def _prefix_query(self, term: str) -> SearchQuery:
+        """tsquery 접두사 검색어 (따옴표로 감싸 연산자 문자 무력화)"""
+        escaped = term.replace("\\", "\\\\").replace("'", "''")
+        return SearchQuery(
+            f"'{escaped}':*", config=self.search_config, search_type="raw"
+        )
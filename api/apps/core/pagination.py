@@ -0,0 +1,98 @@
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db import connection
+from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+
+class EstimatedPage(Page):
+    """추정 count 페이지 (다음 페이지 여부를 실제 조회 결과로 판단)"""
+
+    def __init__(self, object_list, number, paginator, has_more=False):
+        super().__init__(object_list, number, paginator)
+        self.has_more = has_more
+
+    def has_next(self):
+        return self.has_more
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    COUNT(*) 전체 스캔을 피하는 Paginator
+
+    - 필터 없는 쿼리셋: pg_class.reltuples 통계 추정치 사용
+    - 필터된 쿼리셋: 정확한 COUNT (추정치로는 마지막 페이지 도달을 보장할 수 없음)
+    - 추정 count 사용 시 페이지 상한을 두지 않아 실제 행이 있는 페이지는 항상 조회 가능
+    """
+
+    # 추정치가 이보다 작으면 정확한 COUNT 사용 (작은 테이블은 COUNT가 저렴)
+    estimate_threshold = 10000
+    # count가 통계 추정치인지 여부 (count 계산 시 설정)
+    is_estimated = False
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+
+        if not queryset.query.where:
+            estimate = self._estimate_rows(queryset.model._meta.db_table)
+            if estimate >= self.estimate_threshold:
+                self.is_estimated = True
+                return estimate
+
+        return queryset.count()
+
+    def validate_number(self, number):
+        if not (self.count and self.is_estimated):
+            return super().validate_number(number)
+
+        # 추정치는 실제 행 수보다 작을 수 있으므로 상한(num_pages) 검사 생략
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(_("That page number is not an integer"))
+        if number < 1:
+            raise EmptyPage(_("That page number is less than 1"))
+        return number
+
+    def page(self, number):
+        if not (self.count and self.is_estimated):
+            return super().page(number)
+
+        # 추정 count로 마지막 페이지를 자르지 않고 실제 행 기준으로 슬라이스
+        # (1행 더 조회해 다음 페이지 존재 여부 판단)
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom:bottom + self.per_page + 1])
+        return EstimatedPage(
+            rows[:self.per_page], number, self,
+            has_more=len(rows) > self.per_page,
+        )
+
+    @staticmethod
+    def _estimate_rows(table_name: str) -> int:
+        """pg_class 통계 기반 테이블 행 수 추정 (ANALYZE 전이면 -1)"""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                [table_name],
+            )
+            row = cursor.fetchone()
+        return row[0] if row else -1
+
+
+class EstimatedCountPagination(PageNumberPagination):
+    """대용량 테이블용 페이지네이션 (추정 count 사용)"""
+
+    django_paginator_class = EstimatedCountPaginator
+
+
+class CreatedAtCursorPagination(CursorPagination):
+    """
+    (created_at, id) 키셋 기반 커서 페이지네이션
+
+    OFFSET 스캔과 COUNT(*) 없이 인덱스 탐색만으로 다음 페이지 조회
+    """
+
+    ordering = ("-created_at", "-id")
+    page_size = 50
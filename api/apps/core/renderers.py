@@ -0,0 +1,49 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# orjson이 직접 처리하지 못하는 타입(Decimal, lazy str 등)은 DRF 인코더로 위임
+_drf_default = JSONEncoder().default
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    orjson 기반 JSON 렌더러
+
+    stdlib json 대신 C 구현 orjson으로 인코딩 (dataclass, datetime, UUID 네이티브 지원)
+    """
+
+    options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        renderer_context = renderer_context or {}
+        options = self.options
+        if self.get_indent(accepted_media_type, renderer_context):
+            options |= orjson.OPT_INDENT_2
+
+        return orjson.dumps(data, default=_drf_default, option=options)
+
+
+def stream_json_array(serializer, objects):
+    """
+    객체를 하나씩 직렬화해 JSON 배열 조각(bytes)으로 내보내는 제너레이터
+
+    StreamingHttpResponse에 넘겨 serializer.data 전체를 메모리에 올리지 않고 응답
+
+    Args:
+        serializer: 단건 Serializer 인스턴스 (to_representation 재사용)
+        objects: 직렬화할 객체 iterable (QuerySet.iterator() 권장)
+    """
+    yield b"["
+    separator = b""
+    for obj in objects:
+        yield separator + orjson.dumps(
+            serializer.to_representation(obj),
+            default=_drf_default,
+            option=ORJSONRenderer.options,
+        )
+        separator = b","
+    yield b"]"
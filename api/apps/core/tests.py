@@ -0,0 +1,89 @@
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase
+
+from apps.products.models import Product
+
+from .pagination import EstimatedCountPaginator
+from .utils import parse_bool
+
+
+class ParseBoolTests(SimpleTestCase):
+    """쿼리 파라미터 bool 변환"""
+
+    def test_true_values(self):
+        for value in ("true", "1", "yes", "on", "y", "t", "TRUE", "Yes"):
+            with self.subTest(value=value):
+                self.assertIs(parse_bool(value), True)
+
+    def test_false_values(self):
+        for value in ("false", "0", "no", "off", "n", "f", "FALSE", "No"):
+            with self.subTest(value=value):
+                self.assertIs(parse_bool(value), False)
+
+    def test_missing_or_unknown_values(self):
+        for value in (None, "", "maybe", "2"):
+            with self.subTest(value=value):
+                self.assertIsNone(parse_bool(value))
+
+
+class EstimatedCountPaginatorTests(TestCase):
+    """추정 count Paginator (필터 여부별 count, 페이지 접근)"""
+
+    ROW_COUNT = 30
+
+    @classmethod
+    def setUpTestData(cls):
+        Product.objects.bulk_create(
+            Product(
+                product_name=f"제품{i}",
+                permit_number=f"P-{i:04d}",
+                is_combination=i % 3 == 0,
+            )
+            for i in range(cls.ROW_COUNT)
+        )
+
+    def _paginator(self, queryset, estimate):
+        paginator = EstimatedCountPaginator(queryset.order_by("id"), 20)
+        paginator.estimate_threshold = 1
+        patcher = mock.patch.object(
+            EstimatedCountPaginator, "_estimate_rows", return_value=estimate
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return paginator
+
+    def test_unfiltered_uses_estimate(self):
+        paginator = self._paginator(Product.objects.all(), estimate=50000)
+
+        self.assertEqual(paginator.count, 50000)
+        self.assertTrue(paginator.is_estimated)
+
+    def test_unfiltered_below_threshold_uses_exact_count(self):
+        paginator = self._paginator(Product.objects.all(), estimate=-1)
+
+        self.assertEqual(paginator.count, self.ROW_COUNT)
+        self.assertFalse(paginator.is_estimated)
+
+    def test_filtered_uses_exact_count(self):
+        paginator = self._paginator(
+            Product.objects.filter(is_combination=True), estimate=50000
+        )
+
+        self.assertEqual(paginator.count, 10)
+        self.assertFalse(paginator.is_estimated)
+
+    def test_pages_past_low_estimate_are_reachable(self):
+        paginator = self._paginator(Product.objects.all(), estimate=10)
+
+        first = paginator.page(1)
+        self.assertTrue(first.has_next())
+
+        second = paginator.page(2)
+        self.assertEqual(len(second), 10)
+        self.assertFalse(second.has_next())
+
+    def test_high_estimate_stops_at_last_row(self):
+        paginator = self._paginator(Product.objects.all(), estimate=50000)
+
+        self.assertFalse(paginator.page(2).has_next())
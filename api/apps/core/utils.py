@@ -0,0 +1,15 @@
+# 쿼리 파라미터 bool 문자열
+TRUE_VALUES = frozenset(("true", "1", "yes", "on", "y", "t"))
+FALSE_VALUES = frozenset(("false", "0", "no", "off", "n", "f"))
+
+
+def parse_bool(value: str | None) -> bool | None:
+    """쿼리 파라미터 문자열을 bool로 변환 (없거나 알 수 없는 값은 None)"""
+    if value is None:
+        return None
+    value = value.lower()
+    if value in TRUE_VALUES:
+        return True
+    if value in FALSE_VALUES:
+        return False
+    return None
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from apps.products.services import product_service
+
+
+class Command(BaseCommand):
+    """
+    제품 주성분 개수(ingredient_count) 재계산
+
+    bulk_create / QuerySet.update / QuerySet.delete 등 시그널 없이 성분을 변경하는
+    대량 적재 이후 또는 주기적(cron) 보정용
+    """
+
+    help = "제품별 주성분 개수(ingredient_count)를 성분 테이블 기준으로 재계산"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "product_ids",
+            nargs="*",
+            type=int,
+            help="대상 제품 ID (생략 시 전체 제품)",
+        )
+
+    def handle(self, *args, **options):
+        product_ids = options["product_ids"] or None
+        updated = product_service.refresh_ingredient_counts(product_ids)
+        self.stdout.write(self.style.SUCCESS(f"{updated}개 제품의 주성분 개수 갱신"))
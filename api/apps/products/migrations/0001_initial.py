@@ -0,0 +1,60 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:19
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('compounds', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Product',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('product_name', models.CharField(db_index=True, max_length=255, verbose_name='제품명')),
+                ('permit_number', models.CharField(db_index=True, max_length=50, unique=True, verbose_name='허가번호')),
+                ('manufacturer', models.CharField(blank=True, db_index=True, max_length=255, null=True, verbose_name='제조사')),
+                ('is_combination', models.BooleanField(db_index=True, default=False, verbose_name='복합제 여부')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('source', models.CharField(default='MFDS', max_length=50, verbose_name='데이터 출처')),
+                ('last_synced_at', models.DateTimeField(blank=True, null=True, verbose_name='최종 동기화 시각')),
+            ],
+            options={
+                'verbose_name': '의약품 제품',
+                'verbose_name_plural': '의약품 제품 목록',
+                'db_table': 'products',
+                'indexes': [models.Index(fields=['product_name', 'manufacturer'], name='products_product_efa22e_idx'), models.Index(fields=['is_combination', 'created_at'], name='products_is_comb_080a3e_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductIngredient',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('raw_ingredient_name', models.CharField(db_index=True, max_length=255, verbose_name='원본 성분명')),
+                ('content', models.CharField(blank=True, max_length=100, null=True, verbose_name='함량')),
+                ('unit', models.CharField(blank=True, max_length=20, null=True, verbose_name='함량 단위')),
+                ('is_main_active', models.BooleanField(db_index=True, default=True, verbose_name='주성분 여부')),
+                ('ingredient_type', models.CharField(choices=[('ACTIVE', '주성분'), ('EXCIPIENT', '첨가제'), ('UNKNOWN', '미분류')], default='ACTIVE', max_length=50, verbose_name='성분 유형')),
+                ('normalization_status', models.CharField(choices=[('PENDING', '대기중'), ('SUCCESS', '성공'), ('FAILED', '실패'), ('MANUAL', '수동 매핑')], db_index=True, default='PENDING', max_length=20, verbose_name='정규화 상태')),
+                ('normalization_error', models.TextField(blank=True, null=True, verbose_name='정규화 오류 메시지')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('compound', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='products', to='compounds.compound', verbose_name='화합물')),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ingredients', to='products.product', verbose_name='제품')),
+            ],
+            options={
+                'verbose_name': '제품-성분 매핑',
+                'verbose_name_plural': '제품-성분 매핑 목록',
+                'db_table': 'product_ingredients',
+                'indexes': [models.Index(fields=['normalization_status', 'is_main_active'], name='product_ing_normali_b0cc99_idx'), models.Index(fields=['compound', 'is_main_active'], name='product_ing_compoun_6b3850_idx')],
+                'unique_together': {('product', 'raw_ingredient_name')},
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('compounds', '0005_compound_search_vector'),
+        ('products', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='productingredient',
+            index=models.Index(fields=['product', 'is_main_active'], include=('compound', 'raw_ingredient_name'), name='pi_product_main_cov'),
+        ),
+    ]
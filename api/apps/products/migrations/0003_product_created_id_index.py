@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0002_ingredient_product_main_covering'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['-created_at', '-id'], name='products_created_abe05d_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:20
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0003_product_created_id_index'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='product',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('manufacturer'), name='gin_trgm_ops'), name='prod_mfr_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(condition=models.Q(('is_combination', True)), fields=['-created_at', '-id'], name='prod_comb_idx'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0005_product_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='product',
+            name='ingredient_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='주성분 개수'),
+        ),
+        migrations.RunSQL(
+            sql=(
+                "UPDATE products p SET ingredient_count = ("
+                "SELECT COUNT(*) FROM product_ingredients i "
+                "WHERE i.product_id = p.id AND i.is_main_active)"
+            ),
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
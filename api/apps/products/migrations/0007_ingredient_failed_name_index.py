@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('compounds', '0006_compound_has_structure'),
+        ('products', '0006_product_ingredient_count'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='productingredient',
+            index=models.Index(condition=models.Q(('normalization_status', 'FAILED')), fields=['raw_ingredient_name'], name='pi_fail_name_idx'),
+        ),
+    ]
@@ -1,4 +1,7 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils.translation import gettext_lazy as _
 
 """
@@ -38,6 +41,12 @@ class Product(models.Model):
         db_index=True,
         verbose_name=_("복합제 여부")
     )
+    # 주성분 개수 (ProductIngredient 시그널로 갱신되는 비정규화 컬럼)
+    ingredient_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name=_("주성분 개수")
+    )
 
     # 메타데이터
     created_at = models.DateTimeField(auto_now_add=True)
@@ -55,6 +64,16 @@ class Product(models.Model):
         verbose_name=_("최종 동기화 시각")
     )
 
+    # 전문 검색용 tsvector (DB에서 자동 계산)
+    search_vector = models.GeneratedField(
+        expression=SearchVector(
+            'product_name', 'permit_number', 'manufacturer',
+            config='simple',
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
     class Meta:
         app_label = 'products'
         db_table = 'products'
@@ -63,6 +82,25 @@ class Product(models.Model):
         indexes = [
             models.Index(fields=['product_name', 'manufacturer']),
             models.Index(fields=['is_combination', 'created_at']),
+            # 목록 커서 페이지네이션 (created_at, id) 키셋 탐색용
+            models.Index(fields=['-created_at', '-id']),
+            # manufacturer icontains(UPPER LIKE) 필터용 trigram 인덱스 (pg_trgm 필요)
+            GinIndex(
+                OpClass(Upper('manufacturer'), name='gin_trgm_ops'),
+                name='prod_mfr_trgm_idx',
+            ),
+            # 띄어쓰기 없는 제품명 중간 일치 검색(icontains)용 trigram 인덱스
+            GinIndex(
+                OpClass(Upper('product_name'), name='gin_trgm_ops'),
+                name='prod_name_trgm_idx',
+            ),
+            # 복합제 목록(is_combination=true)을 커서 정렬 순서로 조회하는 부분 인덱스
+            models.Index(
+                fields=['-created_at', '-id'],
+                condition=models.Q(is_combination=True),
+                name='prod_comb_idx',
+            ),
+            GinIndex(fields=['search_vector'], name='prod_search_gin'),
         ]
 
     def __str__(self):
@@ -159,6 +197,18 @@ class ProductIngredient(models.Model):
         indexes = [
             models.Index(fields=['normalization_status', 'is_main_active']),
             models.Index(fields=['compound', 'is_main_active']),
+            # 제품별 (주)성분 조회의 index-only scan용 커버링 인덱스
+            models.Index(
+                fields=['product', 'is_main_active'],
+                include=['compound', 'raw_ingredient_name'],
+                name='pi_product_main_cov',
+            ),
+            # 정규화 실패 성분명 집계(failed_normalizations)용 부분 인덱스
+            models.Index(
+                fields=['raw_ingredient_name'],
+                condition=models.Q(normalization_status='FAILED'),
+                name='pi_fail_name_idx',
+            ),
         ]
 
     def __str__(self):
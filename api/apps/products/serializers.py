@@ -2,6 +2,9 @@ from rest_framework import serializers
 
 from .models import Product, ProductIngredient
 
+# 목록 조회 시 노출할 주성분 최대 개수
+MAIN_INGREDIENTS_LIMIT = 3
+
 
 class ProductIngredientSerializer(serializers.ModelSerializer):
     """제품-성분 매핑 시리얼라이저"""
@@ -42,7 +45,8 @@ class ProductIngredientSerializer(serializers.ModelSerializer):
 class ProductListSerializer(serializers.ModelSerializer):
     """제품 목록용 간소화된 시리얼라이저"""
 
-    ingredient_count = serializers.SerializerMethodField(
+    ingredient_count = serializers.IntegerField(
+        read_only=True,
         help_text="성분 개수"
     )
     main_ingredients = serializers.SerializerMethodField(
@@ -63,22 +67,20 @@ class ProductListSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at']
 
-    def get_ingredient_count(self, obj):
-        """성분 개수 반환"""
-        return obj.ingredients.filter(is_main_active=True).count()
-
     def get_main_ingredients(self, obj):
         """주요 성분 3개 반환"""
-        ingredients = obj.ingredients.filter(
-            is_main_active=True
-        ).select_related('compound')[:3]
+        ingredients = getattr(obj, "prefetched_main", None)
+        if ingredients is None:
+            ingredients = obj.ingredients.filter(
+                is_main_active=True
+            ).select_related('compound').order_by('id')
 
         return [
             {
                 'name': ing.raw_ingredient_name,
                 'compound': ing.compound.standard_name if ing.compound else None
             }
-            for ing in ingredients
+            for ing in ingredients[:MAIN_INGREDIENTS_LIMIT]
         ]
 
 
@@ -90,7 +92,11 @@ class ProductDetailSerializer(serializers.ModelSerializer):
         read_only=True,
         help_text="제품에 포함된 모든 성분"
     )
-    active_ingredient_count = serializers.SerializerMethodField()
+    active_ingredient_count = serializers.IntegerField(
+        source='ingredient_count',
+        read_only=True,
+        help_text="주성분 개수"
+    )
 
     class Meta:
         model = Product
@@ -115,10 +121,6 @@ class ProductDetailSerializer(serializers.ModelSerializer):
             'updated_at',
         ]
 
-    def get_active_ingredient_count(self, obj):
-        """주성분 개수"""
-        return obj.ingredients.filter(is_main_active=True).count()
-
 
 class ProductCreateSerializer(serializers.ModelSerializer):
     """제품 생성용 시리얼라이저"""
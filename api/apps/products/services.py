@@ -1,11 +1,28 @@
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Iterable, Optional
 
-from django.db.models import Count, QuerySet
+from django.core.cache import cache
+from django.db.models import Count, OuterRef, Q, QuerySet, Subquery
+from django.db.models.functions import Coalesce
+
+from apps.core.cache import bump_cache_version, get_cache_version
 
 if TYPE_CHECKING:
     from .models import Product
 
+# 통계 캐시 키 / TTL (제조사 순위는 변동이 적어 더 길게 유지)
+PRODUCT_STATS_CACHE_KEY = "product:stats:v1"
+PRODUCT_STATS_CACHE_TIMEOUT = 300
+PRODUCT_TOP_MANUFACTURERS_CACHE_KEY = "product:stats:top_manufacturers:v1"
+PRODUCT_TOP_MANUFACTURERS_CACHE_TIMEOUT = 3600
+
+# 목록/통계 응답 ETag용 데이터 버전 (시그널 없는 대량 변경 대비 주기적 갱신)
+PRODUCT_DATA_VERSION_KEY = "product:data:version"
+PRODUCT_DATA_VERSION_TIMEOUT = 300
+
+# 정규화 실패 목록 최대 반환 개수
+FAILED_NORMALIZATIONS_LIMIT = 100
+
 
 @dataclass
 class ProductFilterParams:
@@ -31,7 +48,7 @@ class ProductStatistics:
     top_manufacturers: list[dict]
 
 
-@dataclass
+@dataclass(slots=True)
 class FailedNormalizationResult:
     """정규화 실패 결과"""
     total_failed: int
@@ -66,30 +83,119 @@ class ProductService:
 
     def get_statistics(self) -> ProductStatistics:
         """
-        제품 전체 통계 조회
+        제품 전체 통계 조회 (캐시 사용)
 
         Returns:
             통계 정보 dataclass
         """
+        return cache.get_or_set(
+            PRODUCT_STATS_CACHE_KEY,
+            self._compute_statistics,
+            PRODUCT_STATS_CACHE_TIMEOUT,
+        )
+
+    def clear_statistics_cache(self) -> None:
+        """통계 캐시 무효화"""
+        cache.delete_many([
+            PRODUCT_STATS_CACHE_KEY,
+            PRODUCT_TOP_MANUFACTURERS_CACHE_KEY,
+        ])
+
+    def get_data_version(self) -> int:
+        """제품 데이터 버전 (변경 시 갱신, 응답 ETag 계산용)"""
+        return get_cache_version(
+            PRODUCT_DATA_VERSION_KEY, PRODUCT_DATA_VERSION_TIMEOUT
+        )
+
+    def bump_data_version(self) -> None:
+        """제품 데이터 버전 갱신"""
+        bump_cache_version(
+            PRODUCT_DATA_VERSION_KEY, PRODUCT_DATA_VERSION_TIMEOUT
+        )
+
+    def _compute_statistics(self) -> ProductStatistics:
+        """제품 통계 계산"""
         from .models import Product
 
-        total_count = Product.objects.count()
-        combination_count = Product.objects.filter(is_combination=True).count()
+        # 전체/복합제 건수를 단일 집계 쿼리로 계산
+        totals = Product.objects.aggregate(
+            total=Count("id"),
+            combination=Count("id", filter=Q(is_combination=True)),
+        )
 
-        top_manufacturers = list(
-            Product.objects
-            .values("manufacturer")
-            .annotate(product_count=Count("id"))
-            .order_by("-product_count")[:10]
+        top_manufacturers = cache.get_or_set(
+            PRODUCT_TOP_MANUFACTURERS_CACHE_KEY,
+            self._compute_top_manufacturers,
+            PRODUCT_TOP_MANUFACTURERS_CACHE_TIMEOUT,
         )
 
         return ProductStatistics(
-            total_products=total_count,
-            combination_products=combination_count,
-            single_products=total_count - combination_count,
+            total_products=totals["total"],
+            combination_products=totals["combination"],
+            single_products=totals["total"] - totals["combination"],
             top_manufacturers=top_manufacturers,
         )
 
+    def _compute_top_manufacturers(self) -> list[dict]:
+        """제품 수 기준 상위 제조사 10곳"""
+        from .models import Product
+
+        # manufacturer 인덱스만으로 집계 가능하도록 해당 컬럼만 참조
+        # values_list 튜플로 받아 응답용 dict만 한 번 생성
+        rows = (
+            Product.objects
+            .exclude(manufacturer__isnull=True)
+            .values_list("manufacturer")
+            .annotate(product_count=Count("manufacturer"))
+            .order_by("-product_count")[:10]
+        )
+        return [
+            {"manufacturer": manufacturer, "product_count": product_count}
+            for manufacturer, product_count in rows
+        ]
+
+    def refresh_ingredient_count(self, product_id: int) -> None:
+        """
+        제품의 주성분 개수(ingredient_count) 재계산
+
+        Args:
+            product_id: 제품 ID
+        """
+        self.refresh_ingredient_counts([product_id])
+
+    def refresh_ingredient_counts(
+        self,
+        product_ids: Optional[Iterable[int]] = None,
+    ) -> int:
+        """
+        주성분 개수(ingredient_count) 일괄 재계산
+
+        시그널은 개별 save/delete에서만 동작하므로 bulk_create, QuerySet.update/delete로
+        성분을 변경한 뒤에는 이 메서드(또는 refresh_ingredient_counts 명령)로 보정
+
+        Args:
+            product_ids: 대상 제품 ID 목록 (None이면 전체 제품)
+
+        Returns:
+            갱신된 제품 수
+        """
+        from .models import Product, ProductIngredient
+
+        main_count = ProductIngredient.objects.filter(
+            product_id=OuterRef("pk"),
+            is_main_active=True,
+        ).order_by().values("product_id").annotate(
+            count=Count("id")
+        ).values("count")
+
+        products = Product.objects.all()
+        if product_ids is not None:
+            products = products.filter(pk__in=list(product_ids))
+
+        return products.update(
+            ingredient_count=Coalesce(Subquery(main_count), 0)
+        )
+
     def get_product_ingredients(
         self,
         product: "Product",
@@ -164,16 +270,21 @@ class ProductIngredientService:
         Returns:
             실패 결과 dataclass
         """
+        failed = queryset.filter(normalization_status="FAILED")
+
+        # 전체 건수는 DB에서 집계하고 목록은 상위 N개만 조회
+        total_failed = failed.aggregate(
+            total=Count("raw_ingredient_name", distinct=True)
+        )["total"]
         failed_ingredients = list(
-            queryset
-            .filter(normalization_status="FAILED")
+            failed
             .values("raw_ingredient_name")
             .annotate(failure_count=Count("id"))
-            .order_by("-failure_count")
+            .order_by("-failure_count")[:FAILED_NORMALIZATIONS_LIMIT]
         )
 
         return FailedNormalizationResult(
-            total_failed=len(failed_ingredients),
+            total_failed=total_failed,
             failed_ingredients=failed_ingredients,
         )
 
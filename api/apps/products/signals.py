@@ -0,0 +1,35 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Product, ProductIngredient
+from .services import product_service
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+def clear_product_statistics(sender, instance, **kwargs):
+    """제품 변경 시 통계 캐시 무효화"""
+    product_service.clear_statistics_cache()
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+@receiver(post_save, sender=ProductIngredient)
+@receiver(post_delete, sender=ProductIngredient)
+@receiver(post_save, sender="compounds.Compound")
+@receiver(post_delete, sender="compounds.Compound")
+def bump_product_data_version(sender, instance, **kwargs):
+    """목록에 노출되는 제품/성분/화합물 변경 시 ETag 버전 갱신"""
+    product_service.bump_data_version()
+
+
+@receiver(post_save, sender=ProductIngredient)
+@receiver(post_delete, sender=ProductIngredient)
+def refresh_product_ingredient_count(sender, instance, **kwargs):
+    """
+    성분 추가/수정/삭제 시 제품의 주성분 개수 재계산
+
+    bulk_create, QuerySet.update/delete는 시그널을 보내지 않으므로
+    product_service.refresh_ingredient_counts() 또는 refresh_ingredient_counts 명령으로 보정
+    """
+    product_service.refresh_ingredient_count(instance.product_id)
@@ -1,3 +1,160 @@
+import json
+from unittest import mock
+
 from django.test import TestCase
+from rest_framework.test import APIClient
+
+from . import views
+from .models import Product, ProductIngredient
+from .services import product_service
+
+
+class ProductIngredientPaginationTests(TestCase):
+    """성분 목록 페이지네이션 (필터 적용 시 정확한 count)"""
+
+    FAILED_COUNT = 1130
+
+    @classmethod
+    def setUpTestData(cls):
+        product = Product.objects.create(
+            product_name="테스트정", permit_number="TEST-0001"
+        )
+        ProductIngredient.objects.bulk_create(
+            ProductIngredient(
+                product=product,
+                raw_ingredient_name=f"성분{i}",
+                normalization_status="FAILED",
+            )
+            for i in range(cls.FAILED_COUNT)
+        )
+        ProductIngredient.objects.create(
+            product=product,
+            raw_ingredient_name="정상성분",
+            normalization_status="SUCCESS",
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_filtered_count_is_exact(self):
+        response = self.client.get(
+            "/api/ingredients/", {"normalization_status": "FAILED"}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["count"], self.FAILED_COUNT)
+
+    def test_filtered_last_page_is_reachable(self):
+        # PAGE_SIZE 20 기준 마지막 페이지 57 (10행)
+        response = self.client.get(
+            "/api/ingredients/", {"normalization_status": "FAILED", "page": 57}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["results"]), 10)
+        self.assertIsNone(response.data["next"])
+
+
+class IngredientCountSignalTests(TestCase):
+    """ingredient_count 컬럼의 시그널 기반 갱신"""
+
+    def setUp(self):
+        self.product = Product.objects.create(
+            product_name="복합정", permit_number="TEST-0002"
+        )
+
+    def _refresh(self):
+        self.product.refresh_from_db(fields=["ingredient_count"])
+        return self.product.ingredient_count
+
+    def test_counts_main_active_ingredients(self):
+        ProductIngredient.objects.create(
+            product=self.product, raw_ingredient_name="주성분A"
+        )
+        ProductIngredient.objects.create(
+            product=self.product, raw_ingredient_name="주성분B"
+        )
+        ProductIngredient.objects.create(
+            product=self.product,
+            raw_ingredient_name="첨가제",
+            is_main_active=False,
+        )
+
+        self.assertEqual(self._refresh(), 2)
+
+    def test_toggle_main_active_updates_count(self):
+        ingredient = ProductIngredient.objects.create(
+            product=self.product, raw_ingredient_name="주성분A"
+        )
+
+        ingredient.is_main_active = False
+        ingredient.save()
+
+        self.assertEqual(self._refresh(), 0)
+
+    def test_delete_updates_count(self):
+        ingredient = ProductIngredient.objects.create(
+            product=self.product, raw_ingredient_name="주성분A"
+        )
+        ingredient.delete()
+
+        self.assertEqual(self._refresh(), 0)
+
+    def test_bulk_paths_need_explicit_refresh(self):
+        # bulk_create / queryset.update()는 시그널을 보내지 않음
+        ProductIngredient.objects.bulk_create(
+            ProductIngredient(product=self.product, raw_ingredient_name=f"주성분{i}")
+            for i in range(3)
+        )
+        ProductIngredient.objects.filter(raw_ingredient_name="주성분0").update(
+            is_main_active=False
+        )
+        self.assertEqual(self._refresh(), 0)
+
+        updated = product_service.refresh_ingredient_counts([self.product.pk])
+
+        self.assertEqual(updated, 1)
+        self.assertEqual(self._refresh(), 2)
+
+    def test_refresh_all_resets_products_without_ingredients(self):
+        Product.objects.filter(pk=self.product.pk).update(ingredient_count=5)
+
+        product_service.refresh_ingredient_counts()
+
+        self.assertEqual(self._refresh(), 0)
+
+
+class ProductIngredientsActionTests(TestCase):
+    """제품 성분 목록: 소량은 일반 Response, 임계값 초과 시 스트리밍"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.product = Product.objects.create(
+            product_name="다성분정", permit_number="TEST-0003"
+        )
+        ProductIngredient.objects.bulk_create(
+            ProductIngredient(product=cls.product, raw_ingredient_name=f"성분{i}")
+            for i in range(5)
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = f"/api/products/{self.product.pk}/ingredients/"
+
+    def test_small_result_uses_response(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.streaming)
+        self.assertEqual(len(response.data), 5)
+
+    def test_large_result_streams_all_rows(self):
+        with mock.patch.object(views, "INGREDIENT_STREAM_THRESHOLD", 2):
+            response = self.client.get(self.url)
 
-# Create your tests here.
+        self.assertTrue(response.streaming)
+        rows = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(
+            [row["raw_ingredient_name"] for row in rows],
+            [f"성분{i}" for i in range(5)],
+        )
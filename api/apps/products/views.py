@@ -1,9 +1,19 @@
-from dataclasses import asdict
+import hashlib
+from itertools import chain
+from functools import cached_property
 
 from rest_framework import viewsets, filters, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from django.db.models import Count, Prefetch, Q
+from django.db.models import Prefetch, prefetch_related_objects
+from django.http import StreamingHttpResponse
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+
+from apps.core.filters import SearchVectorFilter
+from apps.core.pagination import CreatedAtCursorPagination, EstimatedCountPagination
+from apps.core.renderers import stream_json_array
+from apps.core.utils import parse_bool
 
 from .models import Product, ProductIngredient
 from .serializers import (
@@ -20,6 +30,65 @@ from .services import (
     IngredientFilterParams,
 )
 
+# 목록 Serializer / 커서 페이지네이션이 사용하는 컬럼만 조회
+PRODUCT_LIST_ONLY_FIELDS = (
+    "id",
+    "product_name",
+    "permit_number",
+    "manufacturer",
+    "is_combination",
+    "ingredient_count",
+    "created_at",
+)
+
+# 성분 목록이 이 행 수를 넘을 때만 스트리밍 (그 이하는 일반 DRF Response)
+INGREDIENT_STREAM_THRESHOLD = 1000
+# 성분 목록 스트리밍 시 DB 커서에서 한 번에 가져오는 행 수
+INGREDIENT_STREAM_CHUNK_SIZE = 500
+
+# ProductIngredientSerializer가 사용하는 컬럼만 조회
+INGREDIENT_ONLY_FIELDS = (
+    "id",
+    "raw_ingredient_name",
+    "compound",
+    "compound__standard_name",
+    "compound__cid",
+    "content",
+    "unit",
+    "is_main_active",
+    "ingredient_type",
+    "normalization_status",
+    "normalization_error",
+)
+
+
+def _product_data_etag(request, *args, **kwargs) -> str:
+    """데이터 버전 + 요청 URL / Accept 기반 ETag (변경 없으면 304 응답)"""
+    key = "|".join((
+        str(product_service.get_data_version()),
+        request.get_full_path(),
+        request.META.get("HTTP_ACCEPT", ""),
+    ))
+    return hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()
+
+
+def _main_ingredients_prefetch() -> Prefetch:
+    """주성분만 compound와 함께 prefetch (Serializer에서 추가 쿼리 없음)"""
+    main_ingredients = ProductIngredient.objects.filter(
+        is_main_active=True
+    ).select_related("compound").only(
+        "id",
+        "product_id",
+        "raw_ingredient_name",
+        "compound__standard_name",
+    ).order_by("id")
+
+    return Prefetch(
+        "ingredients",
+        queryset=main_ingredients,
+        to_attr="prefetched_main",
+    )
+
 
 class ProductViewSet(viewsets.ModelViewSet):
     """
@@ -34,10 +103,12 @@ class ProductViewSet(viewsets.ModelViewSet):
     """
 
     queryset = Product.objects.all()
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    # 커서 페이지네이션은 고유한 (created_at, id) 정렬이 필요하므로 정렬 변경 미지원
+    filter_backends = [SearchVectorFilter]
     search_fields = ["product_name", "permit_number", "manufacturer"]
-    ordering_fields = ["created_at", "updated_at", "product_name"]
-    ordering = ["-created_at"]
+    search_vector_field = "search_vector"
+    search_trigram_fields = ("product_name", "manufacturer")
+    pagination_class = CreatedAtCursorPagination
 
     def get_queryset(self):
         """
@@ -47,27 +118,47 @@ class ProductViewSet(viewsets.ModelViewSet):
 
         # 액션별 쿼리 최적화
         if self.action == "list":
-            queryset = queryset.annotate(
-                ingredient_count=Count(
-                    "ingredients",
-                    filter=Q(ingredients__is_main_active=True)
-                )
-            )
+            # 주성분 prefetch는 페이지 단위로 paginate_queryset에서 수행
+            queryset = queryset.only(*PRODUCT_LIST_ONLY_FIELDS)
 
         elif self.action == "retrieve":
             queryset = queryset.prefetch_related(
                 Prefetch(
                     "ingredients",
-                    queryset=ProductIngredient.objects.select_related("compound")
+                    # prefetch 매칭용 product FK + Serializer 컬럼만 조회
+                    queryset=ProductIngredient.objects.select_related(
+                        "compound"
+                    ).only("product", *INGREDIENT_ONLY_FIELDS)
                 )
             )
 
         # 서비스 레이어를 통한 필터링
-        filter_params = self._build_filter_params()
-        queryset = product_service.filter_products(queryset, filter_params)
+        queryset = product_service.filter_products(queryset, self.filter_params)
 
         return queryset
 
+    @method_decorator(condition(etag_func=_product_data_etag))
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    def paginate_queryset(self, queryset):
+        """
+        페이지 슬라이스 이후 주성분 prefetch
+
+        prefetch IN 목록이 page_size 개수로 제한됨
+        """
+        page = super().paginate_queryset(queryset)
+
+        if page is not None and self.action == "list":
+            prefetch_related_objects(page, _main_ingredients_prefetch())
+
+        return page
+
+    @cached_property
+    def filter_params(self) -> ProductFilterParams:
+        """요청 단위로 한 번만 파싱한 필터 파라미터 (ViewSet은 요청마다 생성됨)"""
+        return self._build_filter_params()
+
     def _build_filter_params(self) -> ProductFilterParams:
         """쿼리 파라미터를 ProductFilterParams로 변환"""
         params = self.request.query_params
@@ -76,17 +167,10 @@ class ProductViewSet(viewsets.ModelViewSet):
         manufacturer = params.get("manufacturer")
 
         return ProductFilterParams(
-            is_combination=self._parse_bool(is_combination),
+            is_combination=parse_bool(is_combination),
             manufacturer=manufacturer,
         )
 
-    @staticmethod
-    def _parse_bool(value: str | None) -> bool | None:
-        """문자열을 bool로 변환"""
-        if value is None:
-            return None
-        return value.lower() in ["true", "1", "yes"]
-
     def get_serializer_class(self):
         """
         액션별 Serializer 선택
@@ -112,10 +196,14 @@ class ProductViewSet(viewsets.ModelViewSet):
         Query Parameters:
         - is_main_active: true/false (주성분만 필터링)
         - normalization_status: PENDING/SUCCESS/FAILED/MANUAL
+
+        성분이 INGREDIENT_STREAM_THRESHOLD개를 넘으면 JSON 배열을 스트리밍으로 응답.
+        스트리밍은 200 헤더를 먼저 보낸 뒤 직렬화하므로 DRF 렌더러/예외 처리를 거치지 않고,
+        도중에 오류가 나면 잘린 JSON이 전달됨 (클라이언트는 파싱 실패를 오류로 처리해야 함)
         """
         product = self.get_object()
 
-        is_main_active = self._parse_bool(
+        is_main_active = parse_bool(
             request.query_params.get("is_main_active")
         )
         normalization_status = request.query_params.get("normalization_status")
@@ -124,10 +212,23 @@ class ProductViewSet(viewsets.ModelViewSet):
             product, is_main_active, normalization_status
         )
 
-        serializer = ProductIngredientSerializer(ingredients, many=True)
-        return Response(serializer.data)
+        ingredients = ingredients.only(*INGREDIENT_ONLY_FIELDS).order_by("id")
+
+        # 임계값 + 1행만 먼저 조회해 대용량 여부 판단 (COUNT 쿼리 없음)
+        head = list(ingredients[:INGREDIENT_STREAM_THRESHOLD + 1])
+        if len(head) <= INGREDIENT_STREAM_THRESHOLD:
+            return Response(ProductIngredientSerializer(head, many=True).data)
+
+        rest = ingredients[len(head):].iterator(
+            chunk_size=INGREDIENT_STREAM_CHUNK_SIZE
+        )
+        return StreamingHttpResponse(
+            stream_json_array(ProductIngredientSerializer(), chain(head, rest)),
+            content_type="application/json",
+        )
 
     @action(detail=False, methods=["get"])
+    @method_decorator(condition(etag_func=_product_data_etag))
     def statistics(self, request):
         """
         제품 통계 정보
@@ -135,7 +236,7 @@ class ProductViewSet(viewsets.ModelViewSet):
         GET /api/products/statistics/
         """
         stats = product_service.get_statistics()
-        return Response(asdict(stats))
+        return Response(stats)
 
     def destroy(self, request, *args, **kwargs):
         """
@@ -160,8 +261,12 @@ class ProductIngredientViewSet(viewsets.ReadOnlyModelViewSet):
     retrieve: 특정 매핑 상세 조회
     """
 
-    queryset = ProductIngredient.objects.select_related("product", "compound")
+    # Serializer는 product를 사용하지 않으므로 compound만 JOIN
+    queryset = ProductIngredient.objects.select_related("compound").only(
+        *INGREDIENT_ONLY_FIELDS
+    )
     serializer_class = ProductIngredientSerializer
+    pagination_class = EstimatedCountPagination
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ["raw_ingredient_name", "product__product_name"]
     ordering_fields = ["created_at", "normalization_status"]
@@ -174,13 +279,17 @@ class ProductIngredientViewSet(viewsets.ReadOnlyModelViewSet):
         queryset = super().get_queryset()
 
         # 서비스 레이어를 통한 필터링
-        filter_params = self._build_filter_params()
         queryset = product_ingredient_service.filter_ingredients(
-            queryset, filter_params
+            queryset, self.filter_params
         )
 
         return queryset
 
+    @cached_property
+    def filter_params(self) -> IngredientFilterParams:
+        """요청 단위로 한 번만 파싱한 필터 파라미터 (ViewSet은 요청마다 생성됨)"""
+        return self._build_filter_params()
+
     def _build_filter_params(self) -> IngredientFilterParams:
         """쿼리 파라미터를 IngredientFilterParams로 변환"""
         params = self.request.query_params
@@ -191,17 +300,10 @@ class ProductIngredientViewSet(viewsets.ReadOnlyModelViewSet):
 
         return IngredientFilterParams(
             normalization_status=normalization_status,
-            is_main_active=self._parse_bool(is_main_active),
+            is_main_active=parse_bool(is_main_active),
             product_id=int(product_id) if product_id else None,
         )
 
-    @staticmethod
-    def _parse_bool(value: str | None) -> bool | None:
-        """문자열을 bool로 변환"""
-        if value is None:
-            return None
-        return value.lower() in ["true", "1", "yes"]
-
     @action(detail=False, methods=["get"])
     def failed_normalizations(self, request):
         """
@@ -212,4 +314,4 @@ class ProductIngredientViewSet(viewsets.ReadOnlyModelViewSet):
         result = product_ingredient_service.get_failed_normalizations(
             self.get_queryset()
         )
-        return Response(asdict(result))
\ No newline at end of file
+        return Response(result)
\ No newline at end of file
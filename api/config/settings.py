@@ -49,7 +49,9 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'rest_framework',
+    'django_filters',
     'drf_spectacular',
     'corsheaders',
     'apps.compounds',
@@ -62,6 +64,7 @@ MIDDLEWARE = [
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
+    'django.middleware.http.ConditionalGetMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
@@ -101,9 +104,15 @@ DATABASES = {
         'HOST': env('POSTGRES_HOST', default='127.0.0.1'),
         'PORT': env('POSTGRES_PORT', default='5432'),
         'ATOMIC_REQUESTS': True,
-        'CONN_MAX_AGE': 600,
+        # psycopg 3 커넥션 풀 사용 시 영구 연결(CONN_MAX_AGE)은 0이어야 함
+        'CONN_MAX_AGE': 0,
         'OPTIONS': {
             'connect_timeout': 10,
+            'pool': {
+                'min_size': env.int('POSTGRES_POOL_MIN_SIZE', default=4),
+                'max_size': env.int('POSTGRES_POOL_MAX_SIZE', default=20),
+                'timeout': env.int('POSTGRES_POOL_TIMEOUT', default=10),
+            },
         }
     }
 }
@@ -167,12 +176,12 @@ REST_FRAMEWORK = {
     'PAGE_SIZE': 20,
 
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'apps.core.renderers.ORJSONRenderer',
         'rest_framework.renderers.BrowsableAPIRenderer',
     ],
 
     'DEFAULT_PARSER_CLASSES': [
-        'rest_framework.parsers.JSONParser',
+        'apps.core.parsers.ORJSONParser',
         'rest_framework.parsers.FormParser',
         'rest_framework.parsers.MultiPartParser',
     ],
@@ -1,13 +1,24 @@
+-- 부분 문자열(icontains) 검색용 trigram 인덱스 확장
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+
 CREATE TABLE IF NOT EXISTS products (
     id SERIAL PRIMARY KEY,
     product_name VARCHAR(255) NOT NULL,
     permit_number VARCHAR(50) UNIQUE NOT NULL,
     manufacturer VARCHAR(255),
     is_combination BOOLEAN DEFAULT FALSE,
+    ingredient_count INTEGER DEFAULT 0,
     source VARCHAR(50) DEFAULT 'MFDS',
     last_synced_at TIMESTAMP,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    search_vector TSVECTOR GENERATED ALWAYS AS (
+        to_tsvector('simple',
+            COALESCE(product_name, '') || ' ' ||
+            COALESCE(permit_number, '') || ' ' ||
+            COALESCE(manufacturer, ''))
+    ) STORED
 );
 
 
@@ -21,13 +32,25 @@ CREATE TABLE IF NOT EXISTS compounds (
     molecular_formula VARCHAR(100),
     molecular_weight NUMERIC(12, 4),
     iupac_name TEXT,
-    fingerprint_morgan BYTEA,
-    fingerprint_type VARCHAR(50) DEFAULT 'Morgan_r2_2048',
+    has_structure BOOLEAN DEFAULT FALSE,
     is_valid BOOLEAN DEFAULT TRUE,
     validation_error TEXT,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    pubchem_last_fetched TIMESTAMP
+    pubchem_last_fetched TIMESTAMP,
+    search_vector TSVECTOR GENERATED ALWAYS AS (
+        to_tsvector('simple',
+            COALESCE(standard_name, '') || ' ' ||
+            COALESCE(iupac_name, '') || ' ' ||
+            COALESCE(molecular_formula, ''))
+    ) STORED
+);
+
+
+CREATE TABLE IF NOT EXISTS compound_fingerprints (
+    compound_id INTEGER PRIMARY KEY REFERENCES compounds(id) ON DELETE CASCADE,
+    data BYTEA NOT NULL,
+    fingerprint_type VARCHAR(50) DEFAULT 'Morgan_r2_2048'
 );
 
 
@@ -0,0 +1,99 @@
+-- 기존 DB 스키마 업그레이드 (init_db.sql은 CREATE TABLE IF NOT EXISTS라 기존 테이블에 반영되지 않음)
+-- 여러 번 실행해도 안전하도록 작성 (IF NOT EXISTS / 컬럼 존재 확인)
+-- Django 마이그레이션으로 관리하지 않는 DB 전용 (trigram 외 인덱스는 manage.py sqlmigrate 출력으로 적용)
+-- init_db.sql로 만든 DB를 마이그레이션으로 전환할 때는 이 스크립트 대신
+--   python manage.py migrate --fake-initial
+
+
+-- 부분 문자열(icontains) 검색용 trigram 인덱스 확장
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+
+-- 분자 지문을 compounds.fingerprint_morgan에서 compound_fingerprints(1:1)로 이동
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS compound_fingerprints (
+    compound_id INTEGER PRIMARY KEY REFERENCES compounds(id) ON DELETE CASCADE,
+    data BYTEA NOT NULL,
+    fingerprint_type VARCHAR(50) DEFAULT 'Morgan_r2_2048'
+);
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'compounds' AND column_name = 'fingerprint_morgan'
+    ) THEN
+        INSERT INTO compound_fingerprints (compound_id, data, fingerprint_type)
+        SELECT id, fingerprint_morgan, COALESCE(fingerprint_type, 'Morgan_r2_2048')
+        FROM compounds
+        WHERE fingerprint_morgan IS NOT NULL
+        ON CONFLICT (compound_id) DO NOTHING;
+
+        ALTER TABLE compounds
+            DROP COLUMN fingerprint_morgan,
+            DROP COLUMN IF EXISTS fingerprint_type;
+    END IF;
+END
+$$;
+
+COMMIT;
+
+
+-- 화합물명 / IUPAC명 icontains 검색용 trigram 인덱스
+CREATE INDEX IF NOT EXISTS cmp_name_trgm_idx
+    ON compounds USING gin (UPPER(standard_name) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS cmp_iupac_trgm_idx
+    ON compounds USING gin (UPPER(iupac_name) gin_trgm_ops);
+
+
+-- 화합물 전문 검색용 tsvector 생성 컬럼 (STORED라 추가 시 테이블 재작성)
+ALTER TABLE compounds ADD COLUMN IF NOT EXISTS search_vector TSVECTOR GENERATED ALWAYS AS (
+    to_tsvector('simple',
+        COALESCE(standard_name, '') || ' ' ||
+        COALESCE(iupac_name, '') || ' ' ||
+        COALESCE(molecular_formula, ''))
+) STORED;
+
+
+-- 구조 분석 가능 여부 컬럼 추가 및 기존 데이터 채우기 (지문 이동 이후 실행)
+BEGIN;
+
+ALTER TABLE compounds ADD COLUMN IF NOT EXISTS has_structure BOOLEAN DEFAULT FALSE;
+
+UPDATE compounds SET has_structure = COALESCE(smiles, '') <> '' AND EXISTS (
+    SELECT 1 FROM compound_fingerprints f WHERE f.compound_id = compounds.id
+);
+
+COMMIT;
+
+
+-- 제조사 icontains 필터용 trigram 인덱스 (pg_trgm 확장은 파일 상단에서 생성)
+CREATE INDEX IF NOT EXISTS prod_mfr_trgm_idx
+    ON products USING gin (UPPER(manufacturer) gin_trgm_ops);
+
+-- 띄어쓰기 없는 제품명 중간 일치 검색용 trigram 인덱스
+CREATE INDEX IF NOT EXISTS prod_name_trgm_idx
+    ON products USING gin (UPPER(product_name) gin_trgm_ops);
+
+
+-- 제품 전문 검색용 tsvector 생성 컬럼
+ALTER TABLE products ADD COLUMN IF NOT EXISTS search_vector TSVECTOR GENERATED ALWAYS AS (
+    to_tsvector('simple',
+        COALESCE(product_name, '') || ' ' ||
+        COALESCE(permit_number, '') || ' ' ||
+        COALESCE(manufacturer, ''))
+) STORED;
+
+
+-- 제품별 주성분 개수 컬럼 추가 및 기존 데이터 채우기
+BEGIN;
+
+ALTER TABLE products ADD COLUMN IF NOT EXISTS ingredient_count INTEGER DEFAULT 0;
+
+UPDATE products p SET ingredient_count = (
+    SELECT COUNT(*) FROM product_ingredients i
+    WHERE i.product_id = p.id AND i.is_main_active
+);
+
+COMMIT;